@@ -65,9 +65,13 @@ Why dict-based containers?
 """
 from __future__ import annotations
 
-from time import perf_counter
-from typing import (Any, Callable, Dict, Iterable, Iterator, Mapping, Protocol,
-                    Tuple, Union, cast)
+import weakref
+from time import perf_counter_ns
+from types import FunctionType
+from typing import (Any, Callable, Dict, FrozenSet, Iterable, Iterator,
+                    Mapping, Protocol, Tuple, Union)
+
+from .records import make_state_record
 
 
 # Protocols for backend-neutral array namespace (numpy/jax.numpy/torch-like)
@@ -138,6 +142,8 @@ def init_fn(cfg: Mapping[str, Any], *, xp: XP) -> Tuple[State, Params]:
     - "state0": optional mapping for initial state arrays, e.g. {"T": xp.array(...)}
     - "params": optional mapping for runtime constants/config; this function
       injects the backend as params["backend"]["xp"] = xp.
+    - "state_schema": optional sequence of state keys; when given, state0 is
+      returned as a slotted record (gcmi.core.records) instead of a dict.
 
     Returns
     - (state0, params)
@@ -148,42 +154,172 @@ def init_fn(cfg: Mapping[str, Any], *, xp: XP) -> Tuple[State, Params]:
     - This function performs minimal shaping and does not validate schemas; a
       stricter loader/validator (e.g., pydantic) can wrap cfg ahead of this call.
     """
-    state0_raw = cast(Mapping[str, Any], cfg.get("state0", {}))
-    params_raw = dict(cast(Mapping[str, Any], cfg.get("params", {})))
+    state0_raw: Mapping[str, Any] = cfg.get("state0", {})
+    params_raw: Dict[str, Any] = dict(cfg.get("params", {}))
 
     # Ensure a backend namespace record exists
-    backend = dict(cast(Mapping[str, Any], params_raw.get("backend", {})))
+    backend: Dict[str, Any] = dict(params_raw.get("backend", {}))
     backend["xp"] = xp
     params_raw["backend"] = backend
 
     # Shallow copy of state; callers may convert to device arrays in their own init
     state0: State = dict(state0_raw)  # type: ignore[assignment]
+    schema = cfg.get("state_schema")
+    if schema is not None:
+        state0 = make_state_record(schema)(**state0)  # type: ignore[assignment]
     params: Params = params_raw
     return state0, params
 
 
-def _as_iter(
+def _forcing_getter(
     forcing_stream: Union[
         Iterable[Forcing], Iterator[Forcing], Callable[[int], Forcing]
     ],
-) -> Iterator[Forcing]:
+) -> Callable[[int], Forcing]:
+    """
+    Resolve a forcing stream into a per-step getter k -> Forcing, once before the loop.
+
+    Callables are used as-is; iterables are advanced one item per call and yield
+    {} once exhausted.
+    """
     if callable(forcing_stream):
-        k = 0
+        return forcing_stream
+    if hasattr(forcing_stream, "__iter__"):
+        next_forcing = iter(forcing_stream).__next__
 
-        def gen() -> Iterator[Forcing]:
-            nonlocal k
-            while True:
-                yield cast(Forcing, forcing_stream(k))
-                k += 1
+        def get(k: int) -> Forcing:
+            try:
+                return next_forcing()
+            except StopIteration:
+                return {}
 
-        return gen()
-    if hasattr(forcing_stream, "__iter__"):
-        return iter(cast(Iterable[Forcing], forcing_stream))
+        return get
     raise TypeError(
         "forcing_stream must be an Iterable[Forcing] or Callable[[int], Forcing]"
     )
 
 
+Hook = Callable[[int, State, Diag], None]
+
+
+def _attach_step_sec(diag: Diag, step_sec: float) -> None:
+    """Record a step's wall time under diag["timings"]["step_sec"]."""
+    timings = diag.get("timings")
+    if timings is None:
+        diag["timings"] = {"step_sec": step_sec}
+    else:
+        timings["step_sec"] = step_sec
+
+
+def flush_hooks(hooks: Iterable[Any]) -> None:
+    """
+    Flush buffered output of hooks that expose a flush() method.
+
+    Hooks built by gcmi.hooks factories can buffer sink writes (batch > 1); run loops
+    call this when the loop ends, including when a step or hook raises. Call it
+    yourself when invoking such hooks outside a run loop.
+    """
+    for hook in hooks:
+        flush = getattr(hook, "flush", None)
+        if callable(flush):
+            flush()
+
+
+# inspect.CO_VARKEYWORDS, without importing inspect for the plain-function path
+_CO_VARKEYWORDS = 0x08
+
+
+def _inspect_names(fn: Callable[..., Any]) -> Tuple[FrozenSet[str], bool]:
+    code = fn.__code__ if type(fn) is FunctionType else None
+    if (
+        code is not None
+        and not hasattr(fn, "__wrapped__")
+        and getattr(fn, "__signature__", None) is None
+    ):
+        # Plain Python function without an advertised signature: read names straight
+        # off the code object (much cheaper than building inspect.Parameter objects)
+        n_named = code.co_argcount + code.co_kwonlyargcount
+        return (
+            frozenset(code.co_varnames[:n_named]),
+            bool(code.co_flags & _CO_VARKEYWORDS),
+        )
+    # Wrappers and other callables; inspect is imported only when first needed
+    from inspect import Parameter, signature
+
+    params = signature(fn).parameters.values()
+    return (
+        frozenset(p.name for p in params),
+        any(p.kind is Parameter.VAR_KEYWORD for p in params),
+    )
+
+
+# _signature_names results per callable. Weak keys: a cached entry never keeps a step
+# or hook (and whatever its closure captures, e.g. arrays or open sinks) alive.
+_signature_cache: weakref.WeakKeyDictionary[Any, Tuple[FrozenSet[str], bool]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _signature_names(fn: Callable[..., Any]) -> Tuple[FrozenSet[str], bool]:
+    """
+    Return (declared parameter names, accepts **kwargs) for a callable.
+
+    Results are cached per callable (weakly; callables that cannot be weakly
+    referenced or hashed are inspected on every call). Wrappers exposing __wrapped__
+    and non-function callables go through inspect.signature, which raises
+    TypeError/ValueError when no signature is available.
+    """
+    try:
+        return _signature_cache[fn]
+    except (KeyError, TypeError):
+        # Not cached yet, or fn is not weak-referenceable/hashable
+        pass
+    names = _inspect_names(fn)
+    try:
+        _signature_cache[fn] = names
+    except TypeError:
+        pass
+    return names
+
+
+def _bind_hook(hook: Callable[..., None], *, params: Params, xp: XP) -> Hook:
+    """
+    Resolve a hook's calling convention once and return a (k, state, diag) dispatcher.
+
+    Hooks that name params and/or xp in their signature receive those as keywords
+    (both, if they also accept **kwargs); all other hooks, including ones that only
+    take **kwargs, are invoked as plain hook(k, state, diag). Hooks whose signature
+    cannot be inspected keep the legacy behavior: try the minimal form first and
+    retry with params/xp on TypeError.
+    """
+    try:
+        names, var_keyword = _signature_names(hook)
+    except (TypeError, ValueError):
+
+        def probe(k: int, state: State, diag: Diag) -> None:
+            try:
+                hook(k, state, diag)
+            except TypeError:
+                hook(k, state, diag, params=params, xp=xp)
+
+        return probe
+
+    extra: Dict[str, Any] = {
+        n: v for n, v in (("params", params), ("xp", xp)) if n in names
+    }
+    if extra and var_keyword:
+        # Same keywords as the legacy retry call, which always passed both
+        extra = {"params": params, "xp": xp}
+
+    if not extra:
+        return hook
+
+    def dispatch(k: int, state: State, diag: Diag) -> None:
+        hook(k, state, diag, **extra)
+
+    return dispatch
+
+
 def run_fn(
     init: State,
     params: Params,
@@ -204,6 +340,7 @@ def run_fn(
       2) call step_fn(state, forcing, params, dt, xp=xp),
       3) measure per-step wall time and attach diag["timings"]["step_sec"],
       4) call each hook(k, state, diag, ...) strictly as an observer.
+    - Without hooks, step_sec is attached only to the final diag (report["last_diag"]).
 
     Inputs
     - init:   initial State (from init_fn or user-constructed)
@@ -226,38 +363,49 @@ def run_fn(
       (e.g., with middleware), either rebind gcmi.core.api.step_fn or call your
       own assembled step directly from a custom loop/driver.
     """
-    # Ensure step_fn is callable with the expected signature
-    step = cast(Callable[[State, Forcing, Params, float], Tuple[State, Diag]], step_fn)
+    # Resolve the (possibly rebound) module-level step_fn once per run
+    step = step_fn
 
     st: State = init
     report: Dict[str, Any] = {"timings": {"per_step_sec": []}, "last_diag": None}
 
     # Provide a default dt if not supplied via params; examples can override
-    dt = cast(float, cast(Mapping[str, Any], params.get("time", {})).get("dt", 1.0))
-
-    fiter = _as_iter(forcing_stream)
-
-    for k in range(n_steps):
-        forcing = next(fiter, {})
-        t0 = perf_counter()
-        st, diag = step(st, forcing, params, dt, xp=xp)
-        t1 = perf_counter()
-
-        # Timing
-        dur = t1 - t0
-        # Attach per-step timing into diag for hook consumption
-        (diag.setdefault("timings", {}))["step_sec"] = dur
-        report["timings"]["per_step_sec"].append(dur)
-
-        # Invoke hooks (observational only)
-        for hook in hooks:
-            # Pass-through extra kwargs for richer hook signatures
-            try:
-                hook(k, st, diag)  # type: ignore[misc]
-            except TypeError:
-                # Support hooks that expect named params/xp as described in design
-                hook(k, st, diag, params=params, xp=xp)  # type: ignore[misc]
-
-        report["last_diag"] = diag
-
+    time_cfg: Mapping[str, Any] = params.get("time", {})
+    dt = time_cfg.get("dt", 1.0)
+    if not isinstance(dt, float):
+        dt = float(dt)
+
+    get_forcing = _forcing_getter(forcing_stream)
+    # Resolve each hook's signature once instead of probing it every step
+    dispatchers = [_bind_hook(h, params=params, xp=xp) for h in hooks]
+    # Bind loop invariants to locals once
+    clock = perf_counter_ns
+    # Integer nanosecond durations; converted to seconds once, after the loop
+    durations_ns: list[int] = []
+    record_ns = durations_ns.append
+
+    diag: Diag | None = None
+    try:
+        for k in range(n_steps):
+            forcing = get_forcing(k)
+            t0 = clock()
+            st, diag = step(st, forcing, params, dt, xp=xp)
+            dur_ns = clock() - t0
+            record_ns(dur_ns)
+
+            # Per-step timing is attached only when hooks observe the diag
+            if dispatchers:
+                _attach_step_sec(diag, dur_ns * 1e-9)
+                for dispatch in dispatchers:
+                    dispatch(k, st, diag)
+    finally:
+        # Write out anything hooks buffered (e.g., batched sink lines), also when a
+        # step or hook raised: those records are the ones needed to debug it
+        flush_hooks(hooks)
+
+    # Only the final diag is reported; attach its timing once here
+    if diag is not None and not dispatchers:
+        _attach_step_sec(diag, durations_ns[-1] * 1e-9)
+    report["last_diag"] = diag
+    report["timings"]["per_step_sec"] = [d * 1e-9 for d in durations_ns]
     return st, report
@@ -0,0 +1,123 @@
+"""
+Opt-in slotted State records.
+
+State is a plain dict by default. For a fixed, known set of prognostic variables
+(e.g., "T", "q", "u", "v") a slotted record stores each field in a slot, giving a
+smaller per-instance footprint and attribute access (state.T) at slot-descriptor
+speed. Records keep the mapping protocol used throughout GCMI (state[v],
+state[v] = x, v in state, keys/items/get), so steps, middleware, and hooks work
+unchanged; subscript access goes through a Python-level __getitem__ and is slower
+than a dict lookup, so hot code written for records should use attributes.
+Field names may not shadow the mapping API (keys, items, get, ...).
+
+Usage:
+    cfg = {"state_schema": ("T", "q"), "state0": {"T": T0, "q": q0}}
+    state0, params = init_fn(cfg, xp=np)   # state0 is a StateRecord instance
+
+    # or directly
+    Record = make_state_record(("T", "q"))
+    state = Record(T=T0, q=q0)
+"""
+
+from __future__ import annotations
+
+import keyword
+from collections.abc import Mapping
+from dataclasses import fields, make_dataclass
+from functools import lru_cache
+from typing import Any, FrozenSet, Iterator, Sequence, Tuple
+
+__all__ = ["StateRecord", "make_state_record"]
+
+
+class StateRecord:
+    """Mapping-compatible base class for slotted state records (see make_state_record)."""
+
+    __slots__ = ()
+    # Field names in declaration order, and as a set for O(1) membership checks;
+    # both are set on each generated record type
+    _gcmi_keys: Tuple[str, ...] = ()
+    _gcmi_fields: FrozenSet[str] = frozenset()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._gcmi_fields:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self._gcmi_fields:
+            raise KeyError(f"'{key}' is not a field of {type(self).__name__}")
+        setattr(self, key, value)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._gcmi_fields
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._gcmi_keys)
+
+    def __len__(self) -> int:
+        return len(self._gcmi_keys)
+
+    def keys(self) -> Tuple[str, ...]:
+        return self._gcmi_keys
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        return ((k, getattr(self, k)) for k in self._gcmi_keys)
+
+    def values(self) -> Iterator[Any]:
+        return (getattr(self, k) for k in self._gcmi_keys)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self._gcmi_fields else default
+
+
+# Records are Mappings for isinstance checks (e.g., in validators); the
+# registration is virtual, so the slotted layout is unaffected
+Mapping.register(StateRecord)
+
+# Names a field must not take: they would shadow the mapping API or record internals
+_RESERVED = frozenset(dir(StateRecord))
+
+
+@lru_cache(maxsize=64)
+def _record_type(keys: Tuple[str, ...]) -> type[StateRecord]:
+    cls = make_dataclass(
+        "StateRecord_" + "_".join(keys),
+        list(keys),
+        bases=(StateRecord,),
+        slots=True,
+    )
+    cls._gcmi_keys = tuple(f.name for f in fields(cls))
+    cls._gcmi_fields = frozenset(cls._gcmi_keys)
+    return cls
+
+
+def make_state_record(keys: Sequence[str]) -> type[StateRecord]:
+    """
+    Return a slotted record type with one field per state key.
+
+    Types are cached per key tuple, so repeated calls with the same schema return
+    the same class (instances compare equal field-by-field).
+
+    Raises:
+        ValueError: if keys is empty, contains duplicates, contains a key that is
+            not a valid Python identifier (e.g., "T-2m" or a keyword), or uses a
+            reserved name (a mapping method such as keys/items/get, or a
+            dunder/_gcmi name).
+    """
+    key_tuple = tuple(keys)
+    if not key_tuple or len(set(key_tuple)) != len(key_tuple):
+        raise ValueError(
+            f"State schema must be non-empty with unique keys, got {key_tuple}"
+        )
+    invalid = [
+        k
+        for k in key_tuple
+        if not isinstance(k, str) or not k.isidentifier() or keyword.iskeyword(k)
+    ]
+    if invalid:
+        raise ValueError(f"State schema keys must be identifiers, got {invalid}")
+    reserved = [k for k in key_tuple if k in _RESERVED or k.startswith(("__", "_gcmi"))]
+    if reserved:
+        raise ValueError(f"State schema uses reserved field names: {reserved}")
+    return _record_type(key_tuple)
@@ -7,6 +7,7 @@ WSGI analogy:
 Public API:
 - StepCallable: protocol for step callables
 - make_runner: bind step+cfg+xp(+hooks) to create a small runner callable
+- Runner: protocol of the callable returned by make_runner
 - run: one-shot helper to init and execute a run
 
 Example:
@@ -22,6 +23,6 @@ Example:
 
 from __future__ import annotations
 
-from .minimal import StepCallable, make_runner, run
+from .minimal import Runner, StepCallable, make_runner, run
 
-__all__ = ["StepCallable", "make_runner", "run"]
+__all__ = ["Runner", "StepCallable", "make_runner", "run"]
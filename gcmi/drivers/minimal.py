@@ -21,22 +21,33 @@ Public (Driver) API
     dt: float | None = None,
   ) -> tuple[State, Mapping[str, Any]]
 
-- make_runner(step, *, xp, cfg=None, hooks=(), dt=None) -> (forcing_stream, n_steps) -> (state, report)
+- make_runner(step, *, xp, cfg=None, hooks=(), dt=None) -> (forcing_stream, n_steps, *, report_out=None) -> (state, report)
 
 Step signature flexibility (Driver level)
 - Preferred minimal:   step(dt, state, *, xp) -> (state, diag)
 - Also accepted:       step(dt, state, forcing=None, *, xp) / step(dt, state, forcing=None, params=None, *, xp)
 - Back-compatible:     step(state, forcing, params, dt, *, xp)
 - The driver inspects available parameter names and passes only what the function accepts.
+
+Report
+- report["timings"]["per_step_sec"]: list of per-step wall times (seconds)
+- report["timings"]["per_step_sec_arr"]: the same values as a float64 NumPy array
+- report["last_diag"]: diag of the final step (with timings.step_sec)
+- When forcing_stream is omitted, steps receive a shared read-only empty mapping as
+  forcing; steps must not mutate forcing or params.
 """
 
 from __future__ import annotations
 
-import inspect
-from time import perf_counter
+from time import perf_counter_ns
 from typing import (Any, Callable, Iterable, Iterator, Mapping, Protocol, Tuple, Union)
 
-from gcmi.core.api import XP, Diag, Forcing, Params, State, init_fn
+import numpy as np
+
+from gcmi.core.api import (XP, Diag, Forcing, Params, State, _attach_step_sec,
+                           _bind_hook)
+from gcmi.core.api import _forcing_getter as _core_forcing_getter
+from gcmi.core.api import _signature_names, flush_hooks, init_fn
 
 # Hook signature (observational only) aligned with core hooks
 Hook = Callable[[int, dict[str, Any], dict[str, Any]], None]
@@ -57,27 +68,31 @@ class StepCallable(Protocol):
 ForcingStream = Union[Iterable[Forcing], Iterator[Forcing], Callable[[int], Forcing]]
 
 
-def _as_iter(forcing_stream: ForcingStream | None) -> Iterator[Forcing]:
-    """Normalize a forcing stream into an iterator. If None, yield {} forever."""
-    if forcing_stream is None:
-        def gen() -> Iterator[Forcing]:
-            while True:
-                yield {}
-        return gen()
+class _FrozenEmpty(dict):
+    """Empty dict that rejects mutation (still a dict, as the Forcing contract says)."""
+
+    __slots__ = ()
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("default forcing is read-only; steps must not mutate forcing")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    update = setdefault = pop = popitem = clear = _readonly
 
-    if callable(forcing_stream):
-        k = 0
 
-        def gen() -> Iterator[Forcing]:
-            nonlocal k
-            while True:
-                yield forcing_stream(k)
-                k += 1
+# Shared stand-in for omitted forcing: one object for every step and run
+_EMPTY: Forcing = _FrozenEmpty()
 
-        return gen()
-    if hasattr(forcing_stream, "__iter__"):
-        return iter(forcing_stream)  # type: ignore[arg-type]
-    raise TypeError("forcing_stream must be Iterable[Forcing] or Callable[[int], Forcing]")
+
+def _empty_forcing(k: int) -> Forcing:
+    return _EMPTY
+
+
+def _forcing_getter(forcing_stream: ForcingStream | None) -> Callable[[int], Forcing]:
+    """Resolve a forcing stream into a per-step getter. If None, always return _EMPTY."""
+    if forcing_stream is None:
+        return _empty_forcing
+    return _core_forcing_getter(forcing_stream)
 
 
 def _normalize_cfg(cfg: Mapping[str, Any] | None) -> Mapping[str, Any]:
@@ -87,45 +102,110 @@ def _normalize_cfg(cfg: Mapping[str, Any] | None) -> Mapping[str, Any]:
     return cfg
 
 
-def _bind_step(step: StepCallable) -> Callable[[State, Forcing, Params, float, XP], Tuple[State, Diag]]:
+# Order in which the adapter forwards the driver-level arguments (by keyword)
+_STEP_ARGS = ("dt", "state", "forcing", "params", "xp")
+
+
+def _normalize_out(out: Any) -> Tuple[State, Diag]:
+    """Validate a step's return value and normalize its diag into a dict."""
+    if not isinstance(out, tuple) or len(out) != 2:
+        raise TypeError("Step function must return a tuple (state, diag)")
+    new_state, diag = out
+    if diag is None:
+        diag = {}
+    elif not isinstance(diag, dict):
+        # Normalize non-dict diags into a dict for hooks/reporting
+        diag = {"diag": diag}
+    return new_state, diag
+
+
+def _bind_step(
+    step: StepCallable, *, params: Params, dt: float, xp: XP
+) -> Callable[[State, Forcing], Tuple[State, Diag]]:
     """Create a stable calling adapter for a given step function.
 
     The adapter:
-    - Resolves the step's accepted parameter names via inspection
-    - Calls with keyword arguments for robustness: dt/state/forcing/params/xp
-    - Passes only parameters that the function actually declares
+    - Resolves the step's accepted parameter names via inspection (once, at bind time)
+    - Is compiled for exactly that set of names, so calls carry no per-step dispatch
+    - Passes only parameters that the function actually declares, by keyword
+    - Pre-binds the run-invariant params, dt and xp, so the loop passes only
+      (state, forcing)
+
+    Callables without an inspectable signature (e.g., some C extensions) are called
+    with the full core order: step(state, forcing, params, dt, xp=xp).
     """
-    sig = inspect.signature(step)
-    accepted = set(sig.parameters.keys())
-
-    def call(state: State, forcing: Forcing, params: Params, dt: float, xp: XP) -> Tuple[State, Diag]:
-        kwargs: dict[str, Any] = {}
-        # Pass only what is accepted by the step signature
-        if "dt" in accepted:
-            kwargs["dt"] = dt
-        if "state" in accepted:
-            kwargs["state"] = state
-        if "forcing" in accepted:
-            kwargs["forcing"] = forcing
-        if "params" in accepted:
-            kwargs["params"] = params
-        if "xp" in accepted:
-            kwargs["xp"] = xp
-
-        # If the function uses the "full" core order (state, forcing, params, dt, *, xp)
-        # this will still work because we pass by keywords.
-        out = step(**kwargs)  # type: ignore[misc]
-        if not isinstance(out, tuple) or len(out) != 2:
-            raise TypeError("Step function must return a tuple (state, diag)")
-        new_state, diag = out
-        if diag is None:
-            diag = {}
-        elif not isinstance(diag, dict):
-            # Normalize non-dict diags into a dict for hooks/reporting
-            diag = {"diag": diag}
-        return new_state, diag
-
-    return call
+    try:
+        accepted, _ = _signature_names(step)
+    except (TypeError, ValueError):
+
+        def call(state: State, forcing: Forcing) -> Tuple[State, Diag]:
+            return _normalize_out(step(state, forcing, params, dt, xp=xp))
+
+        return call
+
+    # If the function uses the "full" core order (state, forcing, params, dt, *, xp)
+    # this will still work because we pass by keywords.
+    args = ", ".join(f"{name}={name}" for name in _STEP_ARGS if name in accepted)
+    src = (
+        "def call(state, forcing, *, params=_params, dt=_dt, xp=_xp):\n"
+        f"    return _normalize_out(_step({args}))\n"
+    )
+    namespace: dict[str, Any] = {
+        "_step": step,
+        "_normalize_out": _normalize_out,
+        "_params": params,
+        "_dt": dt,
+        "_xp": xp,
+    }
+    exec(compile(src, "<gcmi.drivers.minimal step adapter>", "exec"), namespace)
+    return namespace["call"]  # type: ignore[no-any-return]
+
+
+class Runner(Protocol):
+    """Runner returned by make_runner: (forcing_stream, n_steps) -> (final_state, report)."""
+
+    def __call__(
+        self,
+        forcing_stream: ForcingStream | None,
+        n_steps: int,
+        *,
+        report_out: dict[str, Any] | None = None,
+    ) -> Tuple[State, Mapping[str, Any]]: ...
+
+
+def _prepare_report(report_out: dict[str, Any] | None) -> Tuple[dict[str, Any], list[float]]:
+    """Return (report, per_step_sec list), reusing report_out's containers when given."""
+    if report_out is None:
+        per_step_sec: list[float] = []
+        return {"timings": {"per_step_sec": per_step_sec}, "last_diag": None}, per_step_sec
+
+    timings = report_out.get("timings")
+    if not isinstance(timings, dict):
+        timings = report_out["timings"] = {}
+    per_step_sec = timings.get("per_step_sec")
+    if isinstance(per_step_sec, list):
+        per_step_sec.clear()
+    else:
+        per_step_sec = timings["per_step_sec"] = []
+    report_out["last_diag"] = None
+    return report_out, per_step_sec
+
+
+class _TimingBuffer:
+    """Step timings of one run, kept as a flat int64 nanosecond array (no per-step
+    dict or float objects) and published in the report's shape once, after the loop."""
+
+    __slots__ = ("last_ns", "step_ns")
+
+    def __init__(self, n_steps: int) -> None:
+        # n_steps <= 0 runs no steps (range semantics), leaving an empty buffer
+        self.step_ns = np.empty(max(n_steps, 0), dtype=np.int64)
+        self.last_ns = 0
+
+    def publish(self, report: dict[str, Any], per_step_sec: list[float]) -> None:
+        step_sec = self.step_ns * 1e-9
+        per_step_sec.extend(step_sec.tolist())
+        report["timings"]["per_step_sec_arr"] = step_sec
 
 
 def make_runner(
@@ -135,13 +215,19 @@ def make_runner(
     xp: XP,
     hooks: Tuple[Hook, ...] = (),
     dt: float | None = None,
-) -> Callable[[ForcingStream | None, int], Tuple[State, Mapping[str, Any]]]:
+    jit: str | None = None,
+) -> Runner:
     """Create a minimal runner bound to a step, config, backend, and hooks.
 
     Usage (WSGI-like):
         runner = make_runner(step, cfg=None, xp=numpy, hooks=(timer_hook(...),), dt=None)
         final_state, report = runner(None, 10)
 
+        # Sweeps: reuse one report mapping (and its per_step_sec list) across runs
+        report = {}
+        for stream in streams:
+            final_state, _ = runner(stream, 10, report_out=report)
+
     Args:
         step: A StepCallable implementing the (flexible) step contract.
         cfg: Optional config mapping; init_fn will produce (state0, params).
@@ -149,9 +235,11 @@ def make_runner(
         xp: Backend array namespace (e.g., numpy, jax.numpy, torch-like).
         hooks: Observational hooks invoked per step; must not mutate state/params.
         dt: Optional explicit timestep; overrides cfg["params"]["time"]["dt"].
+        jit: Optional compiled fast path. "numba" compiles the whole time loop for a
+             @numba.njit step(state_tuple, dt); no hooks/forcing (see gcmi.drivers.jit).
 
     Returns:
-        A callable (forcing_stream, n_steps) -> (final_state, report)
+        A Runner: (forcing_stream, n_steps, *, report_out=None) -> (final_state, report)
     """
     cfg = _normalize_cfg(cfg)
     state0, params = init_fn(cfg, xp=xp)
@@ -160,34 +248,61 @@ def make_runner(
     params_time = params.get("time", {}) if isinstance(params.get("time", {}), Mapping) else {}
     dt_final = float(dt if dt is not None else params_time.get("dt", 1.0))  # type: ignore[arg-type]
 
-    # Bind step once (no per-iteration signature overhead)
-    call_step = _bind_step(step)
-
-    def run(forcing_stream: ForcingStream | None, n_steps: int) -> Tuple[State, Mapping[str, Any]]:
+    if jit is not None:
+        if jit != "numba":
+            raise ValueError(f"Unsupported jit backend: {jit!r} (expected 'numba')")
+        if hooks:
+            raise ValueError('jit="numba" runners do not support hooks')
+        from .jit import make_numba_runner
+
+        return make_numba_runner(step, state0=state0, dt=dt_final)
+
+    # Bind step and hooks once (no per-iteration or per-run signature overhead)
+    call_step = _bind_step(step, params=params, dt=dt_final, xp=xp)
+    dispatchers = [_bind_hook(h, params=params, xp=xp) for h in hooks]
+
+    def run(
+        forcing_stream: ForcingStream | None,
+        n_steps: int,
+        *,
+        report_out: dict[str, Any] | None = None,
+    ) -> Tuple[State, Mapping[str, Any]]:
         st: State = state0
-        report: dict[str, Any] = {"timings": {"per_step_sec": []}, "last_diag": None}
-        fiter = _as_iter(forcing_stream)
-
-        for k in range(n_steps):
-            forcing = next(fiter, {})
-            t0 = perf_counter()
-            st, diag = call_step(st, forcing, params, dt_final, xp)
-            t1 = perf_counter()
-
-            # Timing into diag + report
-            dur = t1 - t0
-            (diag.setdefault("timings", {}))["step_sec"] = dur
-            report["timings"]["per_step_sec"].append(dur)
-
-            # Invoke hooks (observational only). Support both minimal and richer signatures.
-            for hook in hooks:
-                try:
-                    hook(k, st, diag)  # type: ignore[misc]
-                except TypeError:
-                    hook(k, st, diag, params=params, xp=xp)  # type: ignore[misc]
-
-            report["last_diag"] = diag
-
+        report, per_step_sec = _prepare_report(report_out)
+        get_forcing = _forcing_getter(forcing_stream)
+        timings = _TimingBuffer(n_steps)
+        # Loop-hot names as locals (LOAD_FAST instead of closure/global lookups)
+        clock = perf_counter_ns
+        call = call_step
+        step_ns = timings.step_ns
+        hook_calls = dispatchers
+        attach = _attach_step_sec
+        dur_ns = 0
+
+        diag: Diag | None = None
+        try:
+            for k in range(n_steps):
+                forcing = get_forcing(k)
+                t0 = clock()
+                st, diag = call(st, forcing)
+                dur_ns = clock() - t0
+                step_ns[k] = dur_ns
+
+                # Per-step timing is attached only when hooks observe the diag
+                if hook_calls:
+                    attach(diag, dur_ns * 1e-9)
+                    for dispatch in hook_calls:
+                        dispatch(k, st, diag)
+        finally:
+            # Write out anything hooks buffered (e.g., batched sink lines), also on error
+            flush_hooks(hooks)
+
+        timings.last_ns = dur_ns
+        # Only the final diag is reported; attach its timing once here
+        if diag is not None and not dispatchers:
+            _attach_step_sec(diag, timings.last_ns * 1e-9)
+        report["last_diag"] = diag
+        timings.publish(report, per_step_sec)
         return st, report
 
     return run
@@ -202,6 +317,7 @@ def run(
     forcing_stream: ForcingStream | None = None,
     hooks: Tuple[Hook, ...] = (),
     dt: float | None = None,
+    jit: str | None = None,
 ) -> Tuple[State, Mapping[str, Any]]:
     """One-shot helper: initialize and execute a run with the provided step.
 
@@ -221,4 +337,4 @@ def run(
         - adapts flexible step signatures by parameter name,
         - preserves compatibility with middleware/hooks/tests built on the Core.
     """
-    return make_runner(step, cfg=cfg, xp=xp, hooks=hooks, dt=dt)(forcing_stream, n_steps)
+    return make_runner(step, cfg=cfg, xp=xp, hooks=hooks, dt=dt, jit=jit)(forcing_stream, n_steps)
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
-from .budgets import energy_budget_hook, water_budget_hook
+from gcmi.core.api import flush_hooks
+
+from .budgets import (combined_budget_hook, energy_budget_hook,
+                      water_budget_hook)
 from .timing import timer_hook
 
 __all__ = [
+    "combined_budget_hook",
     "energy_budget_hook",
     "water_budget_hook",
     "timer_hook",
+    "flush_hooks",
 ]
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
-import json
+from functools import partial
 from typing import IO, Any, Callable, Iterable, Mapping, Optional, Sequence
 
+import numpy as np
+
+from gcmi.core.records import StateRecord
 from gcmi.ops import grid as grid_ops
 
+from .sinks import _buffered, _BufferedLineSink, _dumps
+
 Hook = Callable[[int, dict[str, Any], dict[str, Any]], None]
 
 
 def _sum_any(x: Any, *, xp: Any | None) -> float:
     """
-    Backend-neutral summation with graceful fallback to Python sum()/float().
+    Backend-neutral summation with graceful fallback to a NumPy reduction/float().
     """
     if xp is not None:
         try:
@@ -24,7 +29,8 @@ def _sum_any(x: Any, *, xp: Any | None) -> float:
     # Fallbacks
     try:
         if isinstance(x, Iterable) and not isinstance(x, (str, bytes)):
-            return float(sum(x))  # type: ignore[arg-type]
+            # Vectorized reduction instead of boxed Python additions
+            return float(np.asarray(x).sum(dtype=np.float64))
     except Exception:
         pass
     try:
@@ -33,17 +39,243 @@ def _sum_any(x: Any, *, xp: Any | None) -> float:
         return 0.0
 
 
+def _total(x: Any, *, xp: Any | None) -> float:
+    try:
+        return grid_ops.total(x, xp=xp)
+    except Exception:
+        return _sum_any(x, xp=xp)
+
+
+def _batched_totals(arrays: Sequence[Any], *, xp: Any | None) -> list[float]:
+    """
+    Totals of several arrays via one reduction each, stacked so that the results
+    reach the host in a single transfer (one device sync instead of one per array).
+    Falls back to per-array totals when the backend cannot stack.
+    """
+    if not arrays:
+        return []
+    if xp is not None:
+        try:
+            sums = xp.stack([xp.sum(a) for a in arrays])
+            return [float(s) for s in sums.tolist()]
+        except Exception:
+            pass
+    return [_total(a, xp=xp) for a in arrays]
+
+
+def _present_fields(
+    state: Mapping[str, Any], names: Sequence[str]
+) -> tuple[list[str], list[Any]]:
+    """
+    (names present in state, their values). Slotted StateRecords are read through
+    attribute access, which skips their Python-level __getitem__.
+    """
+    if isinstance(state, StateRecord):
+        present = [v for v in names if v in state._gcmi_fields]
+        return present, [getattr(state, v) for v in present]
+    present = [v for v in names if v in state]
+    return present, [state[v] for v in present]
+
+
+def _compute_totals(
+    state: Mapping[str, Any], names: Sequence[str], *, xp: Any | None
+) -> dict[str, float]:
+    """
+    Totals of the named state variables in one batched pass; missing names total 0.0.
+    """
+    present, arrays = _present_fields(state, names)
+    totals = dict.fromkeys(names, 0.0)
+    totals.update(zip(present, _batched_totals(arrays, xp=xp)))
+    return totals
+
+
+def _unique_vars(
+    terms: Sequence[str], term_vars: Mapping[str, Sequence[str]], *extra: str
+) -> tuple[str, ...]:
+    # Unique variables across all terms (first-seen order), so each is reduced once
+    return tuple(
+        dict.fromkeys([v for t in terms for v in term_vars.get(t, ())] + list(extra))
+    )
+
+
+def _energy_terms(
+    totals: Mapping[str, float],
+    terms: Sequence[str],
+    term_vars: Mapping[str, Sequence[str]],
+) -> dict[str, float]:
+    return {t: float(sum(totals[v] for v in term_vars.get(t, ()))) for t in terms}
+
+
+def _check_fmt(fmt: str) -> None:
+    if fmt not in ("csv", "ndjson"):
+        raise ValueError(f"Unsupported fmt: {fmt}")
+
+
+def _csv_template(n_columns: int) -> str:
+    # "{},{},...\n" with one field per column; str.format renders values like str()
+    return ",".join(["{}"] * n_columns) + "\n"
+
+
+_DEFAULT_TERMS: tuple[str, ...] = ("dry_static", "latent", "kinetic")
+# Mapping from energy term name to state keys to sum; placeholders for M1
+_DEFAULT_TERM_VARS: Mapping[str, Sequence[str]] = {
+    "dry_static": ("T",),
+    "latent": ("q",),
+    "kinetic": ("u", "v"),
+}
+
+
+def _is_cupy(xp: Any | None) -> bool:
+    return getattr(xp, "__name__", None) == "cupy"
+
+
+class _TotalsDispatcher:
+    """
+    Per-step totals of a fixed set of state variables.
+
+    By default totals are computed synchronously (totals()). With overlap_every > 0
+    and a CuPy backend (overlaps(xp)), submit() instead queues the reductions on a
+    dedicated non-blocking CUDA stream (ordered after the work that produced the
+    state) and materializes them on the host every `overlap_every` steps, so
+    reduction latency hides behind the following steps. Callbacks then run at
+    materialization time; drain() delivers whatever is still pending.
+
+    Overlap assumes steps return new arrays (the functional step contract): a step
+    that updates the observed arrays in place would race with pending reductions.
+    """
+
+    __slots__ = ("_every", "_names", "_pending", "_stream")
+
+    def __init__(self, names: Sequence[str], *, overlap_every: int) -> None:
+        self._names = tuple(names)
+        self._every = int(overlap_every)
+        self._stream: Any = None
+        self._pending: list[
+            tuple[list[str], Any, Callable[[dict[str, float]], None]]
+        ] = []
+
+    def overlaps(self, xp: Any | None) -> bool:
+        return self._every > 0 and _is_cupy(xp)
+
+    def totals(self, state: Mapping[str, Any], xp: Any | None) -> dict[str, float]:
+        return _compute_totals(state, self._names, xp=xp)
+
+    def submit(
+        self,
+        state: Mapping[str, Any],
+        xp: Any,
+        on_ready: Callable[[dict[str, float]], None],
+    ) -> None:
+        """Queue the reductions on the side stream (only when overlaps(xp))."""
+        if self._stream is None:
+            self._stream = xp.cuda.Stream(non_blocking=True)
+        present, arrays = _present_fields(state, self._names)
+        sums = None
+        if present:
+            # Start reducing only once the producing work on the current stream is done
+            self._stream.wait_event(xp.cuda.get_current_stream().record())
+            with self._stream:
+                sums = xp.stack([xp.sum(a) for a in arrays])
+        self._pending.append((present, sums, on_ready))
+        if len(self._pending) >= self._every:
+            self.drain()
+
+    def drain(self) -> None:
+        if not self._pending:
+            return
+        self._stream.synchronize()
+        pending, self._pending = self._pending, []
+        for present, sums, on_ready in pending:
+            totals = dict.fromkeys(self._names, 0.0)
+            if sums is not None:
+                totals.update(zip(present, [float(x) for x in sums.tolist()]))
+            on_ready(totals)
+
+
+class BudgetHistory:
+    """
+    Time series of budget totals owned by a budget hook (exposed as hook.history).
+
+    One float64 column per name, stored contiguously in a buffer that doubles when
+    full, so recording a step is O(1) and the series can be read as NumPy arrays:
+
+        hook = energy_budget_hook()
+        ...run...
+        hook.history.steps           # int64 array of step indices k
+        hook.history["latent"]       # float64 array of latent totals per step
+
+    The history holds one run: the hook resets it when it observes step k == 0, so a
+    hook reused across runs (e.g., a make_runner sweep) keeps the latest run only.
+    """
+
+    __slots__ = ("_data", "_index", "_n", "_steps", "columns")
+
+    def __init__(self, columns: Sequence[str], *, capacity: int = 256) -> None:
+        self.columns = tuple(columns)
+        self._index = {c: i for i, c in enumerate(self.columns)}
+        self._steps = np.empty(capacity, dtype=np.int64)
+        self._data = np.empty((capacity, len(self.columns)), dtype=np.float64)
+        self._n = 0
+
+    def append(self, k: int, values: Sequence[float]) -> None:
+        n = self._n
+        if n == len(self._steps):
+            cap = max(1, 2 * n)
+            steps = np.empty(cap, dtype=np.int64)
+            data = np.empty((cap, len(self.columns)), dtype=np.float64)
+            steps[:n] = self._steps
+            data[:n] = self._data
+            self._steps, self._data = steps, data
+        self._steps[n] = k
+        self._data[n] = values
+        self._n = n + 1
+
+    def reset(self) -> None:
+        """Drop all recorded steps (keeps the allocated buffers)."""
+        self._n = 0
+
+    @property
+    def steps(self) -> np.ndarray:
+        return self._steps[: self._n]
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self._data[: self._n, self._index[name]]
+
+    def __len__(self) -> int:
+        return self._n
+
+
+def _start_run(dispatcher: _TotalsDispatcher, history: BudgetHistory) -> None:
+    # Step 0 starts a new run: deliver the previous run's pending totals, then
+    # restart the series
+    dispatcher.drain()
+    history.reset()
+
+
+def _attach_hook_api(
+    hook: Hook,
+    dispatcher: _TotalsDispatcher,
+    out: Optional[_BufferedLineSink],
+    history: BudgetHistory,
+) -> Hook:
+    def flush() -> None:
+        dispatcher.drain()
+        if out is not None:
+            out.flush()
+
+    setattr(hook, "flush", flush)
+    setattr(hook, "history", history)
+    return hook
+
+
 def energy_budget_hook(
     *,
-    terms: Sequence[str] = ("dry_static", "latent", "kinetic"),
-    # Mapping from energy term name to state keys to sum; placeholders for M1
-    term_vars: Mapping[str, Sequence[str]] = {
-        "dry_static": ("T",),
-        "latent": ("q",),
-        "kinetic": ("u", "v"),
-    },
+    terms: Sequence[str] = _DEFAULT_TERMS,
+    term_vars: Mapping[str, Sequence[str]] = _DEFAULT_TERM_VARS,
     sink: Optional[IO[str]] = None,
     fmt: str = "csv",  # 'csv' or 'ndjson'
+    batch: int = 1,
+    overlap_every: int = 0,
 ) -> Hook:
     """
     Construct a hook that computes simple energy-like totals from state variables.
@@ -51,42 +283,58 @@ def energy_budget_hook(
     For M1 this is a placeholder that sums selected state arrays by term using a backend-neutral
     total; real energy calculations can replace this mapping later.
 
-    The hook records results under diag['budgets']['energy'] and optionally writes to sink.
-    """
-
-    def hook(k: int, state: dict[str, Any], diag: dict[str, Any], *_, **kwargs) -> None:
-        xp = kwargs.get("xp", None)
-
-        energy: dict[str, float] = {}
-        for term in terms:
-            total_val = 0.0
-            for var in term_vars.get(term, ()):
-                if var in state:
-                    try:
-                        total_val += grid_ops.total(state[var], xp=xp)
-                    except Exception:
-                        total_val += _sum_any(state[var], xp=xp)
-            energy[term] = float(total_val)
+    The hook records the current step's totals under diag['budgets']['energy'] (a
+    term -> total dict), appends them to hook.history (a BudgetHistory time series), and
+    optionally writes to sink. By default every record is written as it is produced;
+    batch > 1 buffers that many records per write, which the run loops flush when they
+    end (call flush() or gcmi.hooks.flush_hooks yourself outside a run loop).
+    Each referenced state variable is reduced once per step, even if several terms use it.
 
-        budgets = diag.setdefault("budgets", {})
-        budgets.setdefault("energy", {})[k] = energy
+    With overlap_every > 0 on CuPy, reductions run on a side CUDA stream and the
+    per-step energy dicts are filled every overlap_every steps (and on flush()).
+    """
+    if sink is not None:
+        _check_fmt(fmt)
+    out = _buffered(sink, batch)
+    dispatcher = _TotalsDispatcher(
+        _unique_vars(terms, term_vars), overlap_every=overlap_every
+    )
+    # CSV row template built once: k followed by one column per term
+    csv_row = _csv_template(1 + len(terms))
+    history = BudgetHistory(terms)
 
-        if sink is None:
+    def emit(k: int, energy: dict[str, float]) -> None:
+        if out is None:
             return
-
         if fmt == "csv":
             # One line per step with comma-separated term totals (order per 'terms')
-            row = [str(k)] + [str(energy.get(t, 0.0)) for t in terms]
-            sink.write(",".join(row) + "\n")
-            sink.flush()
-        elif fmt == "ndjson":
-            rec = {"k": k, "energy": energy}
-            sink.write(json.dumps(rec) + "\n")
-            sink.flush()
+            out.write(csv_row.format(k, *[energy[t] for t in terms]))
         else:
-            raise ValueError(f"Unsupported fmt: {fmt}")
+            out.write(_dumps({"k": k, "energy": energy}) + "\n")
 
-    return hook
+    def record(k: int, energy: dict[str, float], totals: dict[str, float]) -> None:
+        energy.update(_energy_terms(totals, terms, term_vars))
+        history.append(k, [energy[t] for t in terms])
+        emit(k, energy)
+
+    def hook(
+        k: int,
+        state: dict[str, Any],
+        diag: dict[str, Any],
+        *_,
+        xp: Any = None,
+        **kwargs,
+    ) -> None:
+        energy: dict[str, float] = {}
+        diag.setdefault("budgets", {})["energy"] = energy
+        if k == 0:
+            _start_run(dispatcher, history)
+        if dispatcher.overlaps(xp):
+            dispatcher.submit(state, xp, partial(record, k, energy))
+        else:
+            record(k, energy, dispatcher.totals(state, xp))
+
+    return _attach_hook_api(hook, dispatcher, out, history)
 
 
 def water_budget_hook(
@@ -94,35 +342,121 @@ def water_budget_hook(
     var: str = "q",
     sink: Optional[IO[str]] = None,
     fmt: str = "csv",
+    batch: int = 1,
+    overlap_every: int = 0,
 ) -> Hook:
     """
     Construct a hook that computes a simple water budget: total of 'var' (default 'q').
 
-    Records under diag['budgets']['water'] and optionally writes to sink.
+    Records {var: total} under diag['budgets']['water'], appends to hook.history, and
+    optionally writes to sink (buffered and, with overlap_every on CuPy,
+    stream-overlapped as in energy_budget_hook).
     """
+    if sink is not None:
+        _check_fmt(fmt)
+    out = _buffered(sink, batch)
+    dispatcher = _TotalsDispatcher((var,), overlap_every=overlap_every)
+    history = BudgetHistory((var,))
 
-    def hook(k: int, state: dict[str, Any], diag: dict[str, Any], *_, **kwargs) -> None:
-        xp = kwargs.get("xp", None)
-        total_q = 0.0
-        if var in state:
-            try:
-                total_q = grid_ops.total(state[var], xp=xp)
-            except Exception:
-                total_q = _sum_any(state[var], xp=xp)
+    def record(k: int, water: dict[str, float], totals: dict[str, float]) -> None:
+        total_q = totals[var]
+        water[var] = total_q
+        history.append(k, (total_q,))
+        if out is None:
+            return
+        if fmt == "csv":
+            out.write(f"{k},{total_q}\n")
+        else:
+            out.write(_dumps({"k": k, var: total_q}) + "\n")
 
-        budgets = diag.setdefault("budgets", {})
-        budgets.setdefault("water", {})[k] = {var: float(total_q)}
+    def hook(
+        k: int,
+        state: dict[str, Any],
+        diag: dict[str, Any],
+        *_,
+        xp: Any = None,
+        **kwargs,
+    ) -> None:
+        water: dict[str, float] = {}
+        diag.setdefault("budgets", {})["water"] = water
+        if k == 0:
+            _start_run(dispatcher, history)
+        if dispatcher.overlaps(xp):
+            dispatcher.submit(state, xp, partial(record, k, water))
+        else:
+            record(k, water, dispatcher.totals(state, xp))
 
-        if sink is None:
-            return
+    return _attach_hook_api(hook, dispatcher, out, history)
 
+
+def combined_budget_hook(
+    *,
+    terms: Sequence[str] = _DEFAULT_TERMS,
+    term_vars: Mapping[str, Sequence[str]] = _DEFAULT_TERM_VARS,
+    water_var: str = "q",
+    sink: Optional[IO[str]] = None,
+    fmt: str = "csv",
+    batch: int = 1,
+    overlap_every: int = 0,
+) -> Hook:
+    """
+    Construct a hook equivalent to energy_budget_hook + water_budget_hook in one pass.
+
+    Every referenced state variable (including water_var, typically shared with the
+    latent term) is reduced once per step. Results are recorded under
+    diag['budgets']['energy'] and diag['budgets']['water'] exactly as the separate
+    hooks do; hook.history has one column per term followed by water_var. With a
+    sink, one record per step is written:
+    - csv:    k,<terms...>,<water_var>
+    - ndjson: {"k": k, "energy": {...}, "water": {water_var: total}}
+    """
+    if sink is not None:
+        _check_fmt(fmt)
+    out = _buffered(sink, batch)
+    dispatcher = _TotalsDispatcher(
+        _unique_vars(terms, term_vars, water_var), overlap_every=overlap_every
+    )
+    csv_row = _csv_template(2 + len(terms))
+    if water_var in terms:
+        raise ValueError(
+            f"water_var {water_var!r} must not also be an energy term name"
+        )
+    history = BudgetHistory((*terms, water_var))
+
+    def record(
+        k: int,
+        energy: dict[str, float],
+        water: dict[str, float],
+        totals: dict[str, float],
+    ) -> None:
+        energy.update(_energy_terms(totals, terms, term_vars))
+        water[water_var] = totals[water_var]
+        history.append(k, [*(energy[t] for t in terms), water[water_var]])
+        if out is None:
+            return
         if fmt == "csv":
-            sink.write(f"{k},{float(total_q)}\n")
-            sink.flush()
-        elif fmt == "ndjson":
-            sink.write(json.dumps({"k": k, var: float(total_q)}) + "\n")
-            sink.flush()
+            out.write(csv_row.format(k, *[energy[t] for t in terms], water[water_var]))
         else:
-            raise ValueError(f"Unsupported fmt: {fmt}")
+            out.write(_dumps({"k": k, "energy": energy, "water": water}) + "\n")
 
-    return hook
+    def hook(
+        k: int,
+        state: dict[str, Any],
+        diag: dict[str, Any],
+        *_,
+        xp: Any = None,
+        **kwargs,
+    ) -> None:
+        energy: dict[str, float] = {}
+        water: dict[str, float] = {}
+        budgets = diag.setdefault("budgets", {})
+        budgets["energy"] = energy
+        budgets["water"] = water
+        if k == 0:
+            _start_run(dispatcher, history)
+        if dispatcher.overlaps(xp):
+            dispatcher.submit(state, xp, partial(record, k, energy, water))
+        else:
+            record(k, energy, water, dispatcher.totals(state, xp))
+
+    return _attach_hook_api(hook, dispatcher, out, history)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import json
+from typing import IO, Any, Optional
+
+try:  # Optional C encoder for NDJSON records (pip install py-gcmi[fast])
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode NumPy scalars/arrays as their Python equivalents (both backends)."""
+    tolist = getattr(obj, "tolist", None)
+    if tolist is not None and type(obj).__module__ == "numpy":
+        return tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps_stdlib(obj: Any) -> str:
+    """Encode a record as compact JSON (stdlib backend)."""
+    return json.dumps(obj, separators=(",", ":"), default=_json_default)
+
+
+if orjson is not None:
+    # Match stdlib json for int dict keys (e.g., diag budgets keyed by step). NumPy
+    # values go through the shared default instead of OPT_SERIALIZE_NUMPY, so records
+    # are identical with or without orjson (e.g., float32 as its float64 value)
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def _dumps(obj: Any) -> str:
+        """Encode a record as compact JSON (orjson backend)."""
+        return orjson.dumps(obj, default=_json_default, option=_ORJSON_OPTIONS).decode()
+
+else:  # pragma: no cover - depends on the environment
+    _dumps = _dumps_stdlib
+
+
+class _BufferedLineSink:
+    """
+    Accumulate lines for a text sink and write them in batches.
+
+    Writing (and flushing) one line per step costs a syscall per step; batching keeps
+    output identical while reducing writes to O(n_steps / batch). Buffered lines are
+    written when the batch is full or when flush() is called (the run loops call it
+    when the loop ends, via gcmi.core.api.flush_hooks).
+    """
+
+    __slots__ = ("_batch", "_buf", "_sink")
+
+    def __init__(self, sink: IO[str], *, batch: int) -> None:
+        self._sink = sink
+        self._batch = max(1, int(batch))
+        self._buf: list[str] = []
+
+    def write(self, line: str) -> None:
+        buf = self._buf
+        buf.append(line)
+        if len(buf) >= self._batch:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buf:
+            self._sink.write("".join(self._buf))
+            self._buf.clear()
+        self._sink.flush()
+
+
+def _buffered(sink: Optional[IO[str]], batch: int) -> Optional[_BufferedLineSink]:
+    return None if sink is None else _BufferedLineSink(sink, batch=batch)
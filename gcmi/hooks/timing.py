@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-import json
 from typing import IO, Any, Callable, Optional
 
+from .sinks import _buffered, _dumps
+
 # Hook signature (observational only): accepts optional params/xp via kwargs
 Hook = Callable[[int, dict[str, Any], dict[str, Any]], None]
 
@@ -12,6 +13,7 @@ def timer_hook(
     sink: Optional[IO[str]] = None,
     fmt: str = "csv",
     include_diag: bool = False,
+    batch: int = 1,
 ) -> Hook:
     """
     Create a timing hook that records per-step elapsed wall-clock time.
@@ -24,10 +26,14 @@ def timer_hook(
               If None, the hook only ensures a timings entry exists in diag.
         fmt: 'csv' or 'ndjson' when sink is provided.
         include_diag: If True and fmt == 'ndjson', include the full diag in the record.
+        batch: Number of records buffered before writing to sink. The default 1 writes
+               every step; larger values are flushed by the run loops when they end.
 
     Returns:
-        A hook callable with signature hook(k, state, diag, ..., params=?, xp=?)
+        A hook callable with signature hook(k, state, diag, ..., params=?, xp=?).
+        Its flush() method writes any buffered records (see gcmi.hooks.flush_hooks).
     """
+    out = _buffered(sink, batch)
 
     def hook(k: int, state: dict[str, Any], diag: dict[str, Any], *_, **__) -> None:
         timings = diag.setdefault("timings", {})
@@ -37,20 +43,20 @@ def timer_hook(
         if step_sec is None:
             return
 
-        if sink is None:
+        if out is None:
             return
 
         if fmt == "csv":
             # Write header once if file is empty? We avoid file state checks for simplicity.
-            sink.write(f"{k},{step_sec}\n")
-            sink.flush()
+            out.write(f"{k},{step_sec}\n")
         elif fmt == "ndjson":
             rec: dict[str, Any] = {"k": k, "step_sec": step_sec}
             if include_diag:
                 rec["diag"] = diag
-            sink.write(json.dumps(rec) + "\n")
-            sink.flush()
+            out.write(_dumps(rec) + "\n")
         else:
             raise ValueError(f"Unsupported fmt: {fmt}")
 
+    if out is not None:
+        setattr(hook, "flush", out.flush)
     return hook
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import math
-from typing import (Any, Callable, Dict, Mapping, Sequence, Tuple, TypedDict,
-                    cast)
+from typing import Any, Callable, Dict, Mapping, Sequence, Tuple, TypedDict
+
+from gcmi.ops import grid as grid_ops
 
 # Loose typing aliases to avoid import cycles with gcmi.core.api
 State = Dict[str, Any]
@@ -17,8 +18,15 @@ class XPProto(TypedDict, total=False):
     pass
 
 
-def _append_mw_meta(diag: Diag, name: str, **meta: Any) -> None:
-    (diag.setdefault("gcmi_mw", [])).append({"name": name, **meta})
+def _append_mw_meta(diag: Diag, entry: Dict[str, Any]) -> None:
+    # entry is a ready-built {"name": ..., **meta} dict; wrappers whose metadata is
+    # fixed at wrap time pass a copy of a prebuilt template
+    # One probe in the common case of an existing list; setdefault would also
+    # build an empty list argument on every call
+    lst = diag.get("gcmi_mw")
+    if lst is None:
+        diag["gcmi_mw"] = lst = []
+    lst.append(entry)
 
 
 def with_cfl_guard(
@@ -26,68 +34,172 @@ def with_cfl_guard(
     *,
     cfl_max: float = 0.8,
     wave_speed_cb: Callable[[State, Params, Any], float],
+    recompute_every: int = 0,
+    n_sub_max: int = 0,
+    collect_meta: bool = True,
 ) -> StepFn:
     """
     Stability middleware: enforce dt against a CFL criterion via optional substepping.
 
     Behavior:
     - Compute vmax = wave_speed_cb(state, params, xp)
-    - dx := params['grid']['dx_min'] if present else 1.0
+    - dx := params['grid']['dx_min'] if present else 1.0 (a non-numeric dx_min raises)
     - cfl := vmax * dt / dx
     - If cfl <= cfl_max: single inner step
     - Else: perform n_sub = ceil(cfl / cfl_max) sub-steps with dt_sub = dt / n_sub
 
+    Args:
+        recompute_every: if > 0, re-evaluate wave_speed_cb on the evolving state every
+            this many substeps and resize the remaining substeps to
+            min(time left, cfl_max * dx / vmax); 0 keeps the entry estimate throughout
+        n_sub_max: if > 0, cap on substeps per call; the last allowed substep takes
+            whatever time is left (bounds cost at the expense of the CFL target)
+        collect_meta: append an entry to diag["gcmi_mw"]; False skips it (production runs)
+            The entry's dt_sub is the last substep taken; dt_sub_min/dt_sub_max bound
+            all substeps (they differ only with recompute_every)
+
     Notes:
     - This is a generic controller; it does not alter physics except time slicing.
-    - Metadata is recorded under diag["gcmi_mw"].
+    - Metadata is recorded under diag["gcmi_mw"] unless collect_meta=False.
+    - cfl_max must be positive (ValueError otherwise).
     """
+    if not cfl_max > 0.0:
+        raise ValueError(f"cfl_max must be positive, got {cfl_max!r}")
+    if recompute_every < 0 or n_sub_max < 0:
+        raise ValueError("recompute_every and n_sub_max must be >= 0")
+    inv_cfl_max = 1.0 / cfl_max
+
+    def adaptive(state, forcing, params, dt, dt_sub, dx, *, xp):
+        # Substeps with wave speed refreshed every recompute_every steps
+        st = state
+        last_diag: Diag = {}
+        t_left = dt
+        # Absorb float residue into the last substep rather than taking a tiny extra one
+        eps = 1e-9 * dt
+        i = 0
+        h_min = h_max = h = dt_sub
+        while t_left > eps:
+            if i and i % recompute_every == 0:
+                vmax = float(wave_speed_cb(st, params, xp))
+                dt_sub = cfl_max * dx / vmax if vmax > 0.0 else t_left
+            h = t_left if n_sub_max and i == n_sub_max - 1 else min(dt_sub, t_left)
+            if t_left - h <= eps:
+                h = t_left
+            st, last_diag = step(st, forcing, params, h, xp=xp)
+            t_left -= h
+            h_min = h if i == 0 else min(h_min, h)
+            h_max = h if i == 0 else max(h_max, h)
+            i += 1
+        return st, last_diag, i, h, h_min, h_max
+
+    def substepped(state, forcing, params, dt, cfl, vmax, dx, *, xp):
+        # Slow path, kept out of wrapped so the single-step case stays lean
+        n_sub = max(1, int(math.ceil(cfl * inv_cfl_max)))
+        if n_sub_max:
+            n_sub = min(n_sub, n_sub_max)
+        dt_sub = dt / n_sub
+        if recompute_every:
+            st, last_diag, n_sub, dt_sub, dt_sub_min, dt_sub_max = adaptive(
+                state, forcing, params, dt, dt_sub, dx, xp=xp
+            )
+        else:
+            dt_sub_min = dt_sub_max = dt_sub
+            st = state
+            last_diag = {}
+            for _ in range(n_sub):
+                st, last_diag = step(st, forcing, params, dt_sub, xp=xp)
+        if collect_meta:
+            _append_mw_meta(
+                last_diag,
+                {
+                    "name": "cfl_guard",
+                    "cfl": cfl,
+                    "n_substeps": n_sub,
+                    "vmax": vmax,
+                    "dx": dx,
+                    "dt": dt,
+                    "dt_sub": dt_sub,
+                    "dt_sub_min": dt_sub_min,
+                    "dt_sub_max": dt_sub_max,
+                },
+            )
+        return st, last_diag
 
     def wrapped(state: State, forcing: Forcing, params: Params, dt: float, *, xp):
         vmax = float(wave_speed_cb(state, params, xp))
-        dx = 1.0
-        try:
-            grid = cast(Mapping[str, Any], params.get("grid", {}))
-            if "dx_min" in grid:
-                dx = float(grid["dx_min"])
-        except Exception:
-            dx = 1.0
-
-        cfl = 0.0 if dx == 0 else vmax * dt / dx
-        if cfl <= cfl_max or dx == 0.0 or vmax == 0.0 or dt == 0.0:
-            st, dg = step(state, forcing, params, dt, xp=xp)
+        grid = params.get("grid")
+        dx = (
+            float(grid["dx_min"])
+            if isinstance(grid, Mapping) and "dx_min" in grid
+            else 1.0
+        )
+
+        # dx, vmax or dt of zero give cfl == 0, which always takes the single step
+        cfl = 0.0 if dx == 0.0 else vmax * dt / dx
+        if not cfl <= cfl_max:  # also routes NaN to the slow path, which raises
+            return substepped(state, forcing, params, dt, cfl, vmax, dx, xp=xp)
+
+        st, dg = step(state, forcing, params, dt, xp=xp)
+        if collect_meta:
             _append_mw_meta(
-                dg, "cfl_guard", cfl=cfl, n_substeps=1, vmax=vmax, dx=dx, dt=dt
+                dg,
+                {
+                    "name": "cfl_guard",
+                    "cfl": cfl,
+                    "n_substeps": 1,
+                    "vmax": vmax,
+                    "dx": dx,
+                    "dt": dt,
+                },
             )
-            return st, dg
-
-        n_sub = max(1, int(math.ceil(cfl / cfl_max)))
-        dt_sub = dt / n_sub if n_sub > 0 else dt
-        st = state
-        last_diag: Diag = {}
-        for _ in range(n_sub):
-            st, last_diag = step(st, forcing, params, dt_sub, xp=xp)
-        _append_mw_meta(
-            last_diag,
-            "cfl_guard",
-            cfl=cfl,
-            n_substeps=n_sub,
-            vmax=vmax,
-            dx=dx,
-            dt=dt,
-            dt_sub=dt_sub,
-        )
-        return st, last_diag
+        return st, dg
 
     setattr(wrapped, "__wrapped__", step)
     return wrapped  # type: ignore[return-value]
 
 
+def _hyperdiff_update(x: Any, lap: Any, coeff: float, *, xp, has_out: bool) -> Any:
+    # Returns x - coeff * lap. lap is the operator's freshly allocated result and
+    # doubles as the output buffer when xp supports out=; x is never written, since
+    # a pass-through step returns the caller's arrays.
+    if not has_out or lap is x:
+        return x - coeff * lap
+    # Fused update into lap: no coeff*lap or x-... temporaries.
+    # Scalars, read-only or integer results fall back out of place.
+    try:
+        xp.multiply(lap, -coeff, out=lap)
+    except Exception:
+        return x - coeff * lap
+    try:
+        xp.add(x, lap, out=lap)
+    except Exception:
+        return x + lap
+    return lap
+
+
+def _stack_groups(st: State, names: Sequence[str]) -> list[list[str]]:
+    # Fields that can be stacked without dtype promotion: same (shape, dtype).
+    # Values without both (scalars, non-arrays) form singleton groups.
+    groups: Dict[Any, list[str]] = {}
+    singles: list[list[str]] = []
+    for v in names:
+        x = st[v]
+        shape = getattr(x, "shape", None)
+        dtype = getattr(x, "dtype", None)
+        if shape is None or dtype is None:
+            singles.append([v])
+        else:
+            groups.setdefault((tuple(shape), dtype), []).append(v)
+    return [*groups.values(), *singles]
+
+
 def with_hyperdiff(
     step: StepFn,
     *,
     coeff: float = 0.0,
     order: int = 4,
     vars: Sequence[str] = ("T", "u", "v"),
+    collect_meta: bool = True,
 ) -> StepFn:
     """
     Add hyperdiffusion (placeholder via ops.grid.laplacian). For M1, laplacian may be a no-op.
@@ -96,21 +208,69 @@ def with_hyperdiff(
         coeff: diffusion coefficient (applied as: var <- var - coeff * Laplacian(var))
         order: nominal order (recorded in metadata only for M1)
         vars: variables to diffuse if present in state
+        collect_meta: append an entry to diag["gcmi_mw"]; False skips it (production runs)
+            The entry's dt_sub is the last substep taken; dt_sub_min/dt_sub_max bound
+            all substeps (they differ only with recompute_every)
+
+    Notes:
+        - The state's arrays are never modified: when xp provides ``multiply``/``add``
+          with ``out=`` the result is computed into the Laplacian's buffer, otherwise
+          as ``var - coeff * lap``. The new arrays replace the entries of the state
+          dict returned by the inner step.
+        - When xp provides ``stack`` and ops.grid.laplacian declares
+          ``supports_batch`` (leading axes are independent fields), present fields
+          with the same shape and dtype are diffused as one (N, ...) batch and
+          written back as views of it; other fields are diffused one by one.
     """
-    from gcmi.ops import grid as grid_ops  # local import to avoid cycles
+    # Backend probe is cached per xp so capability checks are not repeated every step
+    probed_xp: Any = None
+    has_out = False
+    has_stack = False
+
+    meta = {"name": "hyperdiff", "coeff": coeff, "order": order, "vars": tuple(vars)}
 
     def wrapped(state: State, forcing: Forcing, params: Params, dt: float, *, xp):
+        nonlocal probed_xp, has_out, has_stack
         st, dg = step(state, forcing, params, dt, xp=xp)
         if coeff != 0.0:
-            for v in vars:
-                if v in st:
+            if xp is not probed_xp:
+                probed_xp = xp
+                has_out = hasattr(xp, "multiply") and hasattr(xp, "add")
+                has_stack = hasattr(xp, "stack")
+            present = [v for v in vars if v in st]
+            lap_op = grid_ops.laplacian
+            if (
+                has_stack
+                and len(present) > 1
+                and getattr(lap_op, "supports_batch", False)
+            ):
+                singles: list[str] = []
+                for group in _stack_groups(st, present):
+                    if len(group) == 1:
+                        singles.extend(group)
+                        continue
                     try:
-                        lap_v = grid_ops.laplacian(st[v], xp=xp)
-                        st[v] = st[v] - coeff * lap_v  # type: ignore[operator]
+                        X = xp.stack([st[v] for v in group], axis=0)
+                        X = _hyperdiff_update(
+                            X, lap_op(X, xp=xp), coeff, xp=xp, has_out=has_out
+                        )
+                        for i, v in enumerate(group):
+                            st[v] = X[i]
                     except Exception:
-                        # On type incompatibility, skip modification but continue
-                        pass
-        _append_mw_meta(dg, "hyperdiff", coeff=coeff, order=order, vars=tuple(vars))
+                        # Backend cannot stack these: diffuse them one by one
+                        singles.extend(group)
+                present = singles
+            for v in present:
+                try:
+                    x = st[v]
+                    st[v] = _hyperdiff_update(
+                        x, grid_ops.laplacian(x, xp=xp), coeff, xp=xp, has_out=has_out
+                    )
+                except Exception:
+                    # On type incompatibility, skip modification but continue
+                    pass
+        if collect_meta:
+            _append_mw_meta(dg, meta.copy())
         return st, dg
 
     setattr(wrapped, "__wrapped__", step)
@@ -122,14 +282,23 @@ def with_flux_limiter(
     *,
     scheme: str = "mc",
     vars: Sequence[str] = ("q", "T"),
+    collect_meta: bool = True,
 ) -> StepFn:
     """
     Flux limiter (placeholder). For M1, records metadata; no state change.
+
+    Args:
+        collect_meta: append an entry to diag["gcmi_mw"]; False skips it (production runs)
+            The entry's dt_sub is the last substep taken; dt_sub_min/dt_sub_max bound
+            all substeps (they differ only with recompute_every)
     """
 
+    meta = {"name": "flux_limiter", "scheme": scheme, "vars": tuple(vars)}
+
     def wrapped(state: State, forcing: Forcing, params: Params, dt: float, *, xp):
         st, dg = step(state, forcing, params, dt, xp=xp)
-        _append_mw_meta(dg, "flux_limiter", scheme=scheme, vars=tuple(vars))
+        if collect_meta:
+            _append_mw_meta(dg, meta.copy())
         return st, dg
 
     setattr(wrapped, "__wrapped__", step)
@@ -142,24 +311,41 @@ def with_positivity(
     vars: Sequence[str] = ("q",),
     lower: float = 0.0,
     conserve: str | None = None,  # placeholder: not enforced in M1
+    collect_meta: bool = True,
+    inplace: bool = False,
 ) -> StepFn:
     """
     Enforce non-negativity via clamping for selected variables.
+
+    Args:
+        collect_meta: append an entry to diag["gcmi_mw"]; False skips it (production runs)
+            The entry's dt_sub is the last substep taken; dt_sub_min/dt_sub_max bound
+            all substeps (they differ only with recompute_every)
+        inplace: clamp array fields in place (via out=) instead of allocating new
+            ones. Only safe when the inner step returns arrays it allocated itself;
+            with a pass-through step this would modify the caller's state.
     """
-    from gcmi.ops import grid as grid_ops  # local import
+    meta = {
+        "name": "positivity",
+        "vars": tuple(vars),
+        "lower": lower,
+        "conserve": conserve,
+    }
 
     def wrapped(state: State, forcing: Forcing, params: Params, dt: float, *, xp):
         st, dg = step(state, forcing, params, dt, xp=xp)
         for v in vars:
             if v in st:
                 try:
-                    st[v] = grid_ops.clamp_min(st[v], lower, xp=xp)
+                    x = st[v]
+                    clamped = grid_ops.clamp_min(x, lower, xp=xp, inplace=inplace)
+                    if clamped is not x:
+                        st[v] = clamped
                 except Exception:
                     # If clamp fails, skip
                     pass
-        _append_mw_meta(
-            dg, "positivity", vars=tuple(vars), lower=lower, conserve=conserve
-        )
+        if collect_meta:
+            _append_mw_meta(dg, meta.copy())
         return st, dg
 
     setattr(wrapped, "__wrapped__", step)
@@ -170,14 +356,23 @@ def with_energy_fix(
     step: StepFn,
     *,
     budget: Sequence[str] = ("dry_static", "latent", "kinetic"),
+    collect_meta: bool = True,
 ) -> StepFn:
     """
     Global energy budget correction (placeholder). For M1, records metadata only.
+
+    Args:
+        collect_meta: append an entry to diag["gcmi_mw"]; False skips it (production runs)
+            The entry's dt_sub is the last substep taken; dt_sub_min/dt_sub_max bound
+            all substeps (they differ only with recompute_every)
     """
 
+    meta = {"name": "energy_fix", "budget": tuple(budget)}
+
     def wrapped(state: State, forcing: Forcing, params: Params, dt: float, *, xp):
         st, dg = step(state, forcing, params, dt, xp=xp)
-        _append_mw_meta(dg, "energy_fix", budget=tuple(budget))
+        if collect_meta:
+            _append_mw_meta(dg, meta.copy())
         return st, dg
 
     setattr(wrapped, "__wrapped__", step)
@@ -188,14 +383,23 @@ def with_conservation_projection(
     step: StepFn,
     *,
     conserve: Sequence[str] = ("total_mass", "moist_energy"),
+    collect_meta: bool = True,
 ) -> StepFn:
     """
     Projection onto conserved totals (placeholder). For M1, records metadata only.
+
+    Args:
+        collect_meta: append an entry to diag["gcmi_mw"]; False skips it (production runs)
+            The entry's dt_sub is the last substep taken; dt_sub_min/dt_sub_max bound
+            all substeps (they differ only with recompute_every)
     """
 
+    meta = {"name": "conservation_projection", "conserve": tuple(conserve)}
+
     def wrapped(state: State, forcing: Forcing, params: Params, dt: float, *, xp):
         st, dg = step(state, forcing, params, dt, xp=xp)
-        _append_mw_meta(dg, "conservation_projection", conserve=tuple(conserve))
+        if collect_meta:
+            _append_mw_meta(dg, meta.copy())
         return st, dg
 
     setattr(wrapped, "__wrapped__", step)
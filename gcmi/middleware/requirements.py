@@ -26,7 +26,8 @@ from __future__ import annotations
 from typing import Any, Callable, Dict, Mapping, Sequence, Tuple
 
 from gcmi.utils.requirements import (Requirement, RequirementError,
-                                     get_requirements, validate_requirements)
+                                     get_requirements, group_requirements,
+                                     validate_requirements_grouped)
 
 # Loose typing to avoid import-cycle with core types
 StepFn = Callable[
@@ -57,51 +58,68 @@ def with_requirements_check(
         A StepFn with early-step requirements validation.
 
     Notes:
+        - Requirements are collected and grouped by container once, when the
+          wrapper is created (unknown containers raise ValueError). After the
+          last check the wrapper rebinds itself to call the inner step directly, so
+          steady-state steps carry no counter or branch overhead.
         - The count is based on wrapper invocations (may include sub-steps if upstream middleware performs substepping).
         - The wrapper sets __wrapped__ to allow requirement introspection by downstream tooling.
     """
     call_count = 0
+    # Attached requirements are fixed once decorators have run; resolve them once
+    reqs = get_requirements(step) + tuple(extra)
+    state_reqs, params_reqs, forcing_reqs = group_requirements(reqs)
 
-    def wrapped(state, forcing, params, dt, *, xp):
-        nonlocal call_count
-        reqs = ()
-        errors = []
-        warns = []
-        should_check = call_count < max_checks
-
-        if should_check:
-            reqs = get_requirements(step) + tuple(extra)
-            if reqs:
-                errors, warns = validate_requirements(
-                    state=state, params=params, forcing=forcing, requirements=reqs
-                )
-                if errors and raise_on_error:
-                    # Increment call_count to avoid repeated blocking if caller loops
-                    call_count += 1
-                    raise RequirementError(errors)
+    def checking(state, forcing, params, dt, *, xp):
+        nonlocal call_count, impl
+        call = call_count
+        call_count += 1
+        if call_count >= max_checks:
+            # Warmup done: later calls go straight to the inner step
+            impl = step
+
+        errors, warns = validate_requirements_grouped(
+            state=state,
+            params=params,
+            forcing=forcing,
+            state_reqs=state_reqs,
+            params_reqs=params_reqs,
+            forcing_reqs=forcing_reqs,
+        )
+        if errors and raise_on_error:
+            raise RequirementError(errors)
 
         st, diag = step(state, forcing, params, dt, xp=xp)
 
-        if should_check and reqs and record_warnings:
-            if errors or warns:
-                (diag.setdefault("gcmi_requirements", [])).append(
-                    {
-                        "call": call_count,
-                        "max_checks": max_checks,
-                        "checked": len(reqs),
-                        "errors": [
-                            {"where": v.where, "path": v.path, "message": v.message}
-                            for v in errors
-                        ],
-                        "warnings": [
-                            {"where": v.where, "path": v.path, "message": v.message}
-                            for v in warns
-                        ],
-                    }
-                )
-
-        call_count += 1
+        if record_warnings and (errors or warns):
+            (diag.setdefault("gcmi_requirements", [])).append(
+                {
+                    "call": call,
+                    "max_checks": max_checks,
+                    "checked": len(reqs),
+                    "errors": [
+                        {"where": v.where, "path": v.path, "message": v.message}
+                        for v in errors
+                    ],
+                    "warnings": [
+                        {"where": v.where, "path": v.path, "message": v.message}
+                        for v in warns
+                    ],
+                }
+            )
         return st, diag
 
+    impl = checking
+
+    if reqs and max_checks > 0:
+
+        def wrapped(state, forcing, params, dt, *, xp):
+            return impl(state, forcing, params, dt, xp=xp)
+
+    else:
+        # Nothing will ever be checked: plain pass-through, no impl dispatch
+        def wrapped(state, forcing, params, dt, *, xp):
+            return step(state, forcing, params, dt, xp=xp)
+
     setattr(wrapped, "__wrapped__", step)
     return wrapped  # type: ignore[return-value]
@@ -0,0 +1,64 @@
+"""
+Numba reference kernels for gcmi.ops.grid (optional; requires numba).
+
+gcmi.ops.grid dispatches here (stencils only) when xp is NumPy and numba is
+importable. Kernels are compiled eagerly for float32/float64 C-contiguous arrays
+with cache=True, so importing this module compiles them or loads the on-disk cache;
+gcmi.ops.grid.warm_kernels() does that at setup time. Wrappers return None for
+inputs the kernels do not cover (other dtypes, non-contiguous or non-ndarray
+fields); callers then use the xp-generic path.
+
+Elementwise ops (e.g., clamp_min) deliberately have no kernel here: NumPy's ufuncs
+are already compiled loops and beat a parallel kernel's dispatch overhead.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numba
+import numpy as np
+from numba import prange
+
+_FLOATS = (np.dtype(np.float32), np.dtype(np.float64))
+
+
+@numba.njit(
+    [
+        "void(float32[:, ::1], float64, float64, float32[:, ::1])",
+        "void(float64[:, ::1], float64, float64, float64[:, ::1])",
+    ],
+    cache=True,
+    fastmath=True,
+    parallel=True,
+)
+def _laplacian_5point_into(field, inv_dx2, inv_dy2, out):  # pragma: no cover - jitted
+    ny, nx = field.shape
+    for j in prange(ny):
+        jm = j - 1 if j > 0 else ny - 1
+        jp = j + 1 if j < ny - 1 else 0
+        for i in range(nx):
+            im = i - 1 if i > 0 else nx - 1
+            ip = i + 1 if i < nx - 1 else 0
+            c2 = 2.0 * field[j, i]
+            out[j, i] = (field[j, ip] - c2 + field[j, im]) * inv_dx2 + (
+                field[jp, i] - c2 + field[jm, i]
+            ) * inv_dy2
+
+
+def _supported(field: Any, ndim: int | None = None) -> bool:
+    return (
+        isinstance(field, np.ndarray)
+        and field.dtype in _FLOATS
+        and field.flags.c_contiguous
+        and (ndim is None or field.ndim == ndim)
+    )
+
+
+def laplacian_5point(field: Any, inv_dx2: float, inv_dy2: float) -> Any | None:
+    """Periodic 5-point Laplacian of a 2-D field, or None if unsupported."""
+    if not _supported(field, ndim=2):
+        return None
+    out = np.empty_like(field)
+    _laplacian_5point_into(field, inv_dx2, inv_dy2, out)
+    return out
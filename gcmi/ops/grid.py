@@ -10,6 +10,38 @@ class XP(Protocol):
     def asarray(self, x: Any): ...
 
 
+# gcmi.ops._numba once probed: the module, or False when numba is unavailable
+_numba_kernels: Any = None
+
+
+def _numba_for(xp: Any) -> Any:
+    """Numba kernels module when xp is NumPy and numba is installed, else None."""
+    global _numba_kernels
+    if getattr(xp, "__name__", None) != "numpy":
+        return None
+    if _numba_kernels is None:
+        try:
+            from gcmi.ops import _numba
+        except ImportError:
+            _numba_kernels = False
+        else:
+            _numba_kernels = _numba
+    return _numba_kernels or None
+
+
+def warm_kernels() -> bool:
+    """
+    Load the optional Numba kernels now and report whether they are available.
+
+    Importing them compiles the kernels or reads numba's on-disk cache (a noticeable
+    one-off cost); call this during setup so the first laplacian_5point call inside
+    a timed model step does not pay it.
+    """
+    import numpy
+
+    return _numba_for(numpy) is not None
+
+
 def identity(x: Any, *, xp: XP) -> Any:
     """
     Minimal placeholder operator that returns input unchanged.
@@ -27,6 +59,11 @@ def laplacian(
     For M1, we provide a safe no-op that returns zeros_like(field) if available,
     otherwise returns the input unchanged. This establishes the ops facade and
     call sites; numerical implementation can be filled in subsequent milestones.
+
+    Batch contract: laplacian.supports_batch = True declares that the operator acts
+    on the trailing (horizontal) axes only, so a stack of fields along a new axis 0
+    is diffused field by field (middleware such as with_hyperdiff relies on this to
+    batch variables). An implementation that cannot guarantee it must not set it.
     """
     try:
         return xp.zeros_like(field)
@@ -35,45 +72,92 @@ def laplacian(
         return field
 
 
-def clamp_min(field: Any, lower: float, *, xp: XP) -> Any:
+setattr(laplacian, "supports_batch", True)
+
+
+def laplacian_5point(field: Any, *, xp: XP, dx: float = 1.0, dy: float = 1.0) -> Any:
+    """
+    Reference 5-point Laplacian of a 2-D (y, x) field with periodic boundaries.
+    Not batch-safe: it differentiates along axis 0, so stacked fields must not be
+    passed as one array (see laplacian's batch contract).
+
+    Uses the Numba kernel from gcmi.ops._numba for float32/float64 NumPy arrays when
+    numba is installed (see warm_kernels); otherwise an xp.roll-based implementation.
+    """
+    inv_dx2 = 1.0 / (dx * dx)
+    inv_dy2 = 1.0 / (dy * dy)
+    kernels = _numba_for(xp)
+    if kernels is not None:
+        out = kernels.laplacian_5point(field, inv_dx2, inv_dy2)
+        if out is not None:
+            return out
+    c2 = 2.0 * field
+    return (xp.roll(field, -1, axis=1) - c2 + xp.roll(field, 1, axis=1)) * inv_dx2 + (
+        xp.roll(field, -1, axis=0) - c2 + xp.roll(field, 1, axis=0)
+    ) * inv_dy2
+
+
+def clamp_min(field: Any, lower: float, *, xp: XP, inplace: bool = False) -> Any:
     """
     Clamp to a lower bound in a backend-neutral way.
     Falls back to Python max for scalar values if xp.maximum is unavailable.
+
+    With inplace=True the result is written into field via out= when the backend
+    and field allow it (the returned object is then field itself); otherwise a
+    new value is returned as usual.
     """
-    try:
-        return xp.maximum(field, lower)  # type: ignore[arg-type]
-    except Exception:
+    maximum = getattr(xp, "maximum", None)
+    if maximum is not None:
+        if inplace:
+            try:
+                return maximum(field, lower, out=field)
+            except (TypeError, ValueError):
+                # No out= support, scalar/list field, or dtype/read-only mismatch
+                pass
         try:
-            return max(field, lower)  # type: ignore[type-var]
+            return maximum(field, lower)
         except Exception:
-            return field
+            pass
+    try:
+        return max(field, lower)  # type: ignore[type-var]
+    except Exception:
+        return field
 
 
 def total(field: Any, *, xp: XP) -> float:
     """
     Compute a total (sum) in a backend-neutral way.
-    Returns float where possible; otherwise attempts to cast.
+    Returns float where possible; otherwise returns the backend's reduction result.
     """
-    try:
-        s = xp.sum(field)
+    sum_ = getattr(xp, "sum", None)
+    if sum_ is not None:
         try:
-            return float(s)  # type: ignore[arg-type]
+            s = sum_(field)
         except Exception:
-            return s  # type: ignore[return-value]
+            pass
+        else:
+            try:
+                return float(s)  # type: ignore[arg-type]
+            except (TypeError, ValueError):
+                return s  # type: ignore[return-value]
+    # Fallback: if scalar-like
+    try:
+        return float(field)  # type: ignore[arg-type]
     except Exception:
-        # Fallback: if scalar-like
-        try:
-            return float(field)  # type: ignore[arg-type]
-        except Exception:
-            return 0.0
+        return 0.0
 
 
 def dx_min_from_params(params: Mapping[str, Any]) -> float | None:
     """
     Helper to obtain grid.dx_min from params if present.
     """
+    grid = params.get("grid")
+    if not isinstance(grid, Mapping):
+        return None
+    dx = grid.get("dx_min")
+    if dx is None:
+        return None
     try:
-        grid = params.get("grid", {})  # type: ignore[assignment]
-        return float(grid.get("dx_min"))  # type: ignore[arg-type]
-    except Exception:
+        return float(dx)
+    except (TypeError, ValueError):
         return None
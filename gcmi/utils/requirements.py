@@ -6,7 +6,12 @@ Provides:
 - requires: decorator to attach Requirement specs to a StepFn or any callable
 - get_requirements: retrieve attached requirements (follows __wrapped__ chain)
 - validate_requirements: runtime validator producing structured violations
+- group_requirements / validate_requirements_grouped: the same checks with
+  requirements partitioned by container ahead of time (used by the check
+  middleware); violations come grouped by container and unknown containers are
+  rejected up front
 - RequirementError: aggregated error for failing requirements
+- greater_than / at_least / less_than / at_most: C-level comparison predicates
 
 Intended usage:
 - Authors declare what a step function or middleware needs (e.g. params.spectral.radius).
@@ -20,15 +25,66 @@ Notes:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import (Any, Callable, List, Literal, Mapping, Optional, Sequence,
-                    Tuple)
+import operator
+import sys
+import weakref
+from dataclasses import dataclass, field
+from functools import partial
+from typing import (Any, Callable, List, Literal, Mapping, NamedTuple,
+                    Optional, Sequence, Tuple)
 
 Where = Literal["state", "params", "forcing"]
 Severity = Literal["error", "warn"]
 
+# Returned by compiled getters when a path cannot be resolved
+_MISSING: Any = object()
+_LOOKUP_ERRORS = (KeyError, TypeError, IndexError, ValueError)
 
-@dataclass(frozen=True)
+
+def _build_getter(segments: Tuple[str, ...]) -> Callable[[Any], Any]:
+    """
+    Compile a path into getter(root) -> value | _MISSING. Only Mapping objects are
+    descended into; a leaf such as an ndarray never resolves a further segment.
+    One- and two-segment paths (the common cases) get loop-free closures.
+    """
+    if len(segments) == 1:
+        (s0,) = segments
+
+        def get1(root: Any) -> Any:
+            try:
+                return root[s0]
+            except _LOOKUP_ERRORS:
+                return _MISSING
+
+        return get1
+
+    if len(segments) == 2:
+        s0, s1 = segments
+
+        def get2(root: Any) -> Any:
+            try:
+                cur = root[s0]
+                return cur[s1] if isinstance(cur, Mapping) else _MISSING
+            except _LOOKUP_ERRORS:
+                return _MISSING
+
+        return get2
+
+    def get(root: Any) -> Any:
+        cur = root
+        try:
+            for seg in segments:
+                if not isinstance(cur, Mapping):
+                    return _MISSING
+                cur = cur[seg]
+        except _LOOKUP_ERRORS:
+            return _MISSING
+        return cur
+
+    return get
+
+
+@dataclass(frozen=True, slots=True)
 class Requirement:
     """
     A declarative requirement on State/Params/Forcing.
@@ -50,10 +106,60 @@ class Requirement:
     predicate: Optional[Callable[[Any], bool]] = None
     message: Optional[str] = None
     severity: Severity = "error"
+    # Pre-split path and its compiled getter, so validation does not re-parse the
+    # path on every check
+    _segments: Tuple[str, ...] = field(
+        init=False, repr=False, compare=False, default=()
+    )
+    _getter: Callable[[Any], Any] = field(
+        init=False, repr=False, compare=False, default=None  # type: ignore[assignment]
+    )
+    # Violation messages fixed at construction (a custom message wins); only the
+    # parts that depend on the checked value are formatted at validation time
+    _msg_none: str = field(init=False, repr=False, compare=False, default="")
+    _msg_type_prefix: str = field(init=False, repr=False, compare=False, default="")
+    _msg_pred: str = field(init=False, repr=False, compare=False, default="")
+
+    def __post_init__(self) -> None:
+        # Intern the enum-like fields: names built at runtime (e.g., loaded from a
+        # config file) then share the literal's object, so the grouping dict lookup
+        # and severity checks compare by identity first
+        if type(self.where) is str:
+            object.__setattr__(self, "where", sys.intern(self.where))
+        if type(self.severity) is str:
+            object.__setattr__(self, "severity", sys.intern(self.severity))
+        segments = tuple(self.path.split("."))
+        object.__setattr__(self, "_segments", segments)
+        object.__setattr__(self, "_getter", _build_getter(segments))
+        object.__setattr__(
+            self,
+            "_msg_none",
+            f"Container '{self.where}' is None; cannot check path '{self.path}'",
+        )
+        object.__setattr__(self, "_msg_type_prefix", f"Expected type {self.type}, got ")
+        object.__setattr__(
+            self, "_msg_pred", self.message or "Predicate returned False"
+        )
 
+    def __reduce__(self) -> Any:
+        # Rebuild from the init fields; the compiled getter is not picklable
+        return (
+            Requirement,
+            (
+                self.where,
+                self.path,
+                self.required,
+                self.type,
+                self.predicate,
+                self.message,
+                self.severity,
+            ),
+        )
+
+
+class Violation(NamedTuple):
+    """One failed requirement (a NamedTuple: cheap to build, immutable)."""
 
-@dataclass(frozen=True)
-class Violation:
     where: Where
     path: str
     severity: Severity
@@ -73,18 +179,46 @@ class RequirementError(Exception):
         super().__init__("Requirements not satisfied:\n" + "\n".join(msgs))
 
 
-def _get_path(d: Mapping[str, Any], path: str) -> Any:
-    cur: Any = d
-    for seg in path.split("."):
+def _missing_message(container: Mapping[str, Any], r: Requirement) -> str:
+    # Failure path only: re-walk, descending into mappings only, to name the
+    # segment that could not be resolved
+    cur: Any = container
+    for seg in r._segments:
         if not isinstance(cur, Mapping):
-            raise KeyError(
-                f"Path '{path}' invalid: segment '{seg}' encountered non-mapping type {type(cur).__name__}"
+            return (
+                f"Path '{r.path}' invalid: segment '{seg}' encountered non-mapping "
+                f"type {type(cur).__name__}"
             )
         try:
-            cur = cur[seg]  # type: ignore[index]
-        except KeyError as e:
-            raise KeyError(f"Missing key '{seg}' while resolving '{path}'") from e
-    return cur
+            cur = cur[seg]
+        except KeyError:
+            return f"Missing key '{seg}' while resolving '{r.path}'"
+    return f"Path '{r.path}' could not be resolved"
+
+
+def greater_than(bound: Any) -> Callable[[Any], bool]:
+    """
+    Predicate value > bound, e.g. Requirement(..., predicate=greater_than(0)).
+
+    The comparison predicates are functools.partial objects over the operator
+    module, so checking them runs in C without a Python-level lambda frame.
+    """
+    return partial(operator.lt, bound)  # operator.lt(bound, value) == bound < value
+
+
+def at_least(bound: Any) -> Callable[[Any], bool]:
+    """Predicate value >= bound."""
+    return partial(operator.le, bound)
+
+
+def less_than(bound: Any) -> Callable[[Any], bool]:
+    """Predicate value < bound."""
+    return partial(operator.gt, bound)
+
+
+def at_most(bound: Any) -> Callable[[Any], bool]:
+    """Predicate value <= bound."""
+    return partial(operator.ge, bound)
 
 
 def requires(*reqs: Requirement):
@@ -93,7 +227,7 @@ def requires(*reqs: Requirement):
 
     Example:
         @requires(
-            Requirement("params", "spectral.radius", type=(int, float), predicate=lambda r: r > 0)
+            Requirement("params", "spectral.radius", type=(int, float), predicate=greater_than(0))
         )
         def step_fn(...): ...
 
@@ -103,18 +237,25 @@ def requires(*reqs: Requirement):
     def _decorate(fn):
         existing: Tuple[Requirement, ...] = tuple(getattr(fn, "__gcmi_requires__", ()))
         setattr(fn, "__gcmi_requires__", existing + tuple(reqs))
+        # fn may sit inside chains that were already resolved
+        _resolved.clear()
         return fn
 
     return _decorate
 
 
-def get_requirements(fn: Any) -> Tuple[Requirement, ...]:
-    """
-    Retrieve requirement specs from a function, following __wrapped__ chains if present.
+# get_requirements results per callable. Weak keys: cached entries never keep a
+# step alive. Cleared by @requires, the supported way to attach requirements.
+_resolved: weakref.WeakKeyDictionary[Any, Tuple[Requirement, ...]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _collect_requirements(fn: Any) -> Tuple[Requirement, ...]:
+    # Fast path: no __wrapped__ chain to walk (the common case for ad-hoc steps)
+    if getattr(fn, "__wrapped__", None) is None:
+        return tuple(getattr(fn, "__gcmi_requires__", ()))
 
-    Returns:
-        A tuple of Requirement instances (may be empty).
-    """
     reqs: List[Requirement] = []
     seen: set[int] = set()
     cur = fn
@@ -127,53 +268,81 @@ def get_requirements(fn: Any) -> Tuple[Requirement, ...]:
     return tuple(reqs)
 
 
-def validate_requirements(
-    *,
-    state: Mapping[str, Any] | None,
-    params: Mapping[str, Any] | None,
-    forcing: Mapping[str, Any] | None,
-    requirements: Sequence[Requirement],
-) -> Tuple[list[Violation], list[Violation]]:
+def get_requirements(fn: Any) -> Tuple[Requirement, ...]:
     """
-    Validate requirements against provided containers.
+    Retrieve requirement specs from a function, following __wrapped__ chains if present.
+
+    Results are memoized per callable (weakly, for callables that support weak
+    references); @requires invalidates the memo.
 
     Returns:
-        (errors, warnings) as lists of Violation.
+        A tuple of Requirement instances (may be empty).
     """
-    errors: list[Violation] = []
-    warns: list[Violation] = []
+    try:
+        return _resolved[fn]
+    except (KeyError, TypeError):
+        # Not cached yet, or fn is not weak-referenceable/hashable
+        pass
+    reqs = _collect_requirements(fn)
+    try:
+        _resolved[fn] = reqs
+    except TypeError:
+        pass
+    return reqs
+
+
+def group_requirements(
+    requirements: Sequence[Requirement],
+) -> Tuple[Tuple[Requirement, ...], Tuple[Requirement, ...], Tuple[Requirement, ...]]:
+    """
+    Partition requirements by container.
 
-    def get_container(where: Where) -> Mapping[str, Any] | None:
-        if where == "state":
-            return state
-        if where == "params":
-            return params
-        if where == "forcing":
-            return forcing
-        return None
+    Returns:
+        (state_reqs, params_reqs, forcing_reqs), each in declaration order.
 
+    Raises:
+        ValueError: if a requirement names an unknown container.
+    """
+    groups: dict[str, List[Requirement]] = {"state": [], "params": [], "forcing": []}
     for r in requirements:
-        container = get_container(r.where)
-        if container is None:
+        try:
+            groups[r.where].append(r)
+        except KeyError:
+            raise ValueError(
+                f"Unknown requirement container {r.where!r} for path '{r.path}'"
+            ) from None
+    return tuple(groups["state"]), tuple(groups["params"]), tuple(groups["forcing"])
+
+
+def _validate_group(
+    container: Mapping[str, Any] | None,
+    reqs: Sequence[Requirement],
+    errors: list[Violation],
+    warns: list[Violation],
+) -> None:
+    if container is None:
+        for r in reqs:
             v = Violation(
                 where=r.where,
                 path=r.path,
                 severity=r.severity,
-                message=f"Container '{r.where}' is None; cannot check path '{r.path}'",
+                message=r._msg_none,
                 requirement=r,
             )
             (errors if r.severity == "error" else warns).append(v)
-            continue
+        return
 
-        try:
-            value = _get_path(container, r.path)
-        except KeyError as e:
+    # The getters assume a Mapping root; anything else resolves no path at all
+    is_mapping = isinstance(container, Mapping)
+    for r in reqs:
+        value = r._getter(container) if is_mapping else _MISSING
+        if value is _MISSING:
             if r.required:
                 v = Violation(
                     where=r.where,
                     path=r.path,
                     severity=r.severity,
-                    message=r.message or str(e),
+                    message=r.message or _missing_message(container, r),
                     requirement=r,
                 )
                 (errors if r.severity == "error" else warns).append(v)
@@ -185,8 +354,7 @@ def validate_requirements(
                 where=r.where,
                 path=r.path,
                 severity=r.severity,
-                message=r.message
-                or f"Expected type {r.type}, got {type(value).__name__}",
+                message=r.message or r._msg_type_prefix + type(value).__name__,
                 requirement=r,
             )
             (errors if r.severity == "error" else warns).append(v)
@@ -211,9 +379,57 @@ def validate_requirements(
                     where=r.where,
                     path=r.path,
                     severity=r.severity,
-                    message=r.message or "Predicate returned False",
+                    message=r._msg_pred,
                     requirement=r,
                 )
                 (errors if r.severity == "error" else warns).append(v)
 
+
+def validate_requirements_grouped(
+    *,
+    state: Mapping[str, Any] | None,
+    params: Mapping[str, Any] | None,
+    forcing: Mapping[str, Any] | None,
+    state_reqs: Sequence[Requirement] = (),
+    params_reqs: Sequence[Requirement] = (),
+    forcing_reqs: Sequence[Requirement] = (),
+) -> Tuple[list[Violation], list[Violation]]:
+    """
+    Validate pre-partitioned requirements (see group_requirements) against their
+    containers, so each container is resolved once per group rather than per item.
+
+    Returns:
+        (errors, warnings) as lists of Violation, grouped state/params/forcing.
+    """
+    errors: list[Violation] = []
+    warns: list[Violation] = []
+    if state_reqs:
+        _validate_group(state, state_reqs, errors, warns)
+    if params_reqs:
+        _validate_group(params, params_reqs, errors, warns)
+    if forcing_reqs:
+        _validate_group(forcing, forcing_reqs, errors, warns)
+    return errors, warns
+
+
+def validate_requirements(
+    *,
+    state: Mapping[str, Any] | None,
+    params: Mapping[str, Any] | None,
+    forcing: Mapping[str, Any] | None,
+    requirements: Sequence[Requirement],
+) -> Tuple[list[Violation], list[Violation]]:
+    """
+    Validate requirements against provided containers.
+
+    Returns:
+        (errors, warnings) as lists of Violation, in declaration order. A
+        requirement on an unknown container is reported like one on a None
+        container.
+    """
+    errors: list[Violation] = []
+    warns: list[Violation] = []
+    containers = {"state": state, "params": params, "forcing": forcing}
+    for r in requirements:
+        _validate_group(containers.get(r.where), (r,), errors, warns)
     return errors, warns
@@ -13,8 +13,9 @@ Guidelines:
 
 from __future__ import annotations
 
+from functools import lru_cache
 from operator import itemgetter
-from typing import Any, Mapping, Tuple
+from typing import Any, Callable, Mapping, Tuple
 
 __all__ = [
     "take",
@@ -24,6 +25,12 @@ __all__ = [
 ]
 
 
+@lru_cache(maxsize=256)
+def _getter(keys: Tuple[str, ...]) -> Callable[[Mapping[str, Any]], Tuple[Any, ...]]:
+    # Call sites reuse the same key tuples; build each itemgetter only once
+    return itemgetter(*keys)
+
+
 def take(d: Mapping[str, Any], *keys: str) -> Tuple[Any, ...]:
     """
     Destructure required keys from a mapping in one expression.
@@ -43,7 +50,7 @@ def take(d: Mapping[str, Any], *keys: str) -> Tuple[Any, ...]:
     if len(keys) == 1:
         k = keys[0]
         return (d[k],)
-    return itemgetter(*keys)(d)
+    return _getter(keys)(d)
 
 
 def require(d: Mapping[str, Any], *keys: str) -> Tuple[Any, ...]:
@@ -62,7 +69,7 @@ def require(d: Mapping[str, Any], *keys: str) -> Tuple[Any, ...]:
         if len(keys) == 1:
             k = keys[0]
             return (d[k],)
-        return itemgetter(*keys)(d)
+        return _getter(keys)(d)
     except (
         KeyError
     ) as e:  # pragma: no cover - error branch is covered by tests via message check
@@ -73,23 +80,30 @@ def require(d: Mapping[str, Any], *keys: str) -> Tuple[Any, ...]:
         ) from e
 
 
-def _get_path(d: Mapping[str, Any], path: str) -> Any:
+def _walk(d: Mapping[str, Any], segments: Tuple[str, ...], path: str) -> Any:
+    # One try around the whole descent; cur/seg still name the failing step
     cur: Any = d
-    for seg in path.split("."):
-        try:
+    try:
+        for seg in segments:
             cur = cur[seg]  # type: ignore[index]
-        except KeyError as e:
-            raise KeyError(
-                f"Path segment '{seg}' not found while resolving '{path}'."
-            ) from e
-        except TypeError as e:
-            raise TypeError(
-                f"Encountered non-mapping object at segment '{seg}' while resolving '{path}'. "
-                f"Current object type: {type(cur).__name__}"
-            ) from e
+    except KeyError as e:
+        raise KeyError(
+            f"Path segment '{seg}' not found while resolving '{path}'."
+        ) from e
+    except (TypeError, IndexError) as e:
+        raise TypeError(
+            f"Encountered non-mapping object at segment '{seg}' while resolving '{path}'. "
+            f"Current object type: {type(cur).__name__}"
+        ) from e
     return cur
 
 
+@lru_cache(maxsize=1024)
+def _compile_path(path: str) -> Tuple[str, ...]:
+    # Dotted paths repeat across steps; split each distinct one once
+    return tuple(path.split("."))
+
+
 def take_nested(d: Mapping[str, Any], *paths: str) -> Tuple[Any, ...]:
     """
     Extract multiple dotted-path values from a nested mapping.
@@ -101,7 +115,8 @@ def take_nested(d: Mapping[str, Any], *paths: str) -> Tuple[Any, ...]:
         KeyError: if any path segment is missing.
         TypeError: if an intermediate object is not a Mapping.
     """
-    return tuple(_get_path(d, p) for p in paths)
+    # List comprehension rather than a generator: no per-path generator resumption
+    return tuple([_walk(d, _compile_path(p), p) for p in paths])
 
 
 def split_keys(
@@ -116,7 +131,11 @@ def split_keys(
     Note:
         - Keys must exist in 'd' to be included in 'picked'; missing keys are ignored.
         - 'rest' preserves all other keys.
+        - 'picked' follows argument order; 'rest' follows the iteration order of 'd'.
     """
+    # Comprehensions with a frozenset membership test: one pass over d for 'rest',
+    # len(keys) lookups for 'picked', and no per-item dict dispatch
+    is_picked = frozenset(keys).__contains__
     picked: dict[str, Any] = {k: d[k] for k in keys if k in d}
-    rest: dict[str, Any] = {k: v for k, v in d.items() if k not in picked}
+    rest: dict[str, Any] = {k: v for k, v in d.items() if not is_picked(k)}
     return picked, rest
@@ -1,24 +1,24 @@
-import copy
+import gc
+import inspect
+import weakref
 from typing import Any, Dict
 
+import numpy as np
+import pytest
+
 import gcmi.core.api as core_api
 from gcmi.hooks import energy_budget_hook, water_budget_hook
 from gcmi.middleware import with_cfl_guard
+from gcmi.ops import grid as grid_ops
 
 
 class XPStub:
     # Minimal 'xp' stub used by tests; compatible with our hooks/ops placeholders
     def sum(self, x):
-        try:
-            return sum(x)  # works for lists
-        except TypeError:
-            return x  # scalar
+        return sum(x) if isinstance(x, (list, tuple)) else x
 
     def zeros_like(self, x):
-        try:
-            return [0 for _ in x]
-        except TypeError:
-            return 0
+        return [0] * len(x) if isinstance(x, list) else 0
 
 
 def _forcing_fn(k: int) -> Dict[str, Any]:
@@ -27,8 +27,15 @@ def _forcing_fn(k: int) -> Dict[str, Any]:
 
 
 def _copy_state(state: Dict[str, Any]) -> Dict[str, Any]:
-    # Deep copy lists; values are kept simple in tests
-    return copy.deepcopy(state)
+    # Structural copy: fresh lists and dicts, scalars shared (values are kept simple in tests)
+    return {
+        k: (
+            list(v)
+            if isinstance(v, list)
+            else _copy_state(v) if isinstance(v, dict) else v
+        )
+        for k, v in state.items()
+    }
 
 
 def test_conservation_identity_baseline():
@@ -55,7 +62,7 @@ def test_conservation_identity_baseline():
     init_state, init_params = state0, params
 
     # Run
-    final_state, report = core_api.run_fn(
+    final_state, _ = core_api.run_fn(
         init=init_state,
         params=init_params,
         forcing_stream=_forcing_fn,
@@ -74,6 +81,48 @@ def test_conservation_identity_baseline():
     assert float(xp.sum(final_state["v"])) == v0
 
 
+@pytest.mark.parametrize(
+    "dtype, rtol", [(np.float64, 1e-12), (np.float32, 1e-5)], ids=["fp64", "fp32"]
+)
+def test_conservation_numpy_diffusion_precision(monkeypatch, dtype, rtol):
+    """
+    NumPy backend: periodic diffusion conserves totals up to the dtype's rounding,
+    and low-precision state stays in its dtype across steps.
+    """
+    rng = np.random.default_rng(7)
+    state0 = {
+        name: rng.uniform(0.0, 1.0, size=(16, 32)).astype(dtype)
+        for name in ("T", "q", "u", "v")
+    }
+    totals0 = {k: float(np.sum(v, dtype=np.float64)) for k, v in state0.items()}
+    params = {"time": {"dt": 0.1}, "grid": {"dx_min": 1.0}}
+
+    def diffusion_step(state, forcing, params, dt, *, xp):
+        out = {
+            k: (x + dt * grid_ops.laplacian_5point(x, xp=xp)).astype(x.dtype)
+            for k, x in state.items()
+        }
+        return out, {"gcmi_mw": []}
+
+    monkeypatch.setattr(core_api, "step_fn", diffusion_step)
+    final_state, report = core_api.run_fn(
+        init=state0,
+        params=params,
+        forcing_stream=_forcing_fn,
+        xp=np,
+        n_steps=20,
+        hooks=(energy_budget_hook(), water_budget_hook()),
+    )
+
+    for k, total0 in totals0.items():
+        assert final_state[k].dtype == dtype
+        assert np.isclose(
+            float(np.sum(final_state[k], dtype=np.float64)), total0, rtol=rtol
+        )
+    water = report["last_diag"]["budgets"]["water"]["q"]
+    assert np.isclose(water, totals0["q"], rtol=rtol)
+
+
 def test_cfl_guard_substepping_and_metadata():
     """
     CFL guard: when vmax*dt/dx exceeds threshold, uses substepping and records metadata.
@@ -96,7 +145,7 @@ def test_cfl_guard_substepping_and_metadata():
     old = core_api.step_fn
     core_api.step_fn = wrapped  # type: ignore[assignment]
     try:
-        final_state, report = core_api.run_fn(
+        _, report = core_api.run_fn(
             init=state0,
             params=params,
             forcing_stream=_forcing_fn,
@@ -125,7 +174,7 @@ def test_reproducibility_identity_fixed_rng():
     params = {"time": {"dt": 1.0}}
 
     def run_once():
-        st, rep = core_api.run_fn(
+        st, _ = core_api.run_fn(
             init=_copy_state(state0),
             params=params,
             forcing_stream=_forcing_fn,
@@ -141,3 +190,105 @@ def test_reproducibility_identity_fixed_rng():
     assert (
         st1 == st2
     ), "Final states should be identical across runs for identity dynamics"
+
+
+def test_hooks_receive_params_and_xp_by_signature():
+    """
+    Hooks are dispatched by their declared signature: minimal hooks get (k, state, diag),
+    hooks declaring params/xp receive them as keywords.
+    """
+    xp = XPStub()
+    params = {"time": {"dt": 1.0}}
+    calls = []
+
+    def minimal_hook(k, state, diag):
+        calls.append(("minimal", k))
+
+    def rich_hook(k, state, diag, *, params, xp):
+        calls.append(("rich", k, params["time"]["dt"], xp))
+
+    core_api.run_fn(
+        init={"q": [0.1]},
+        params=params,
+        forcing_stream=_forcing_fn,
+        xp=xp,
+        n_steps=2,
+        hooks=(minimal_hook, rich_hook),
+    )
+
+    assert calls == [
+        ("minimal", 0),
+        ("rich", 0, 1.0, xp),
+        ("minimal", 1),
+        ("rich", 1, 1.0, xp),
+    ]
+
+
+def test_kwargs_only_hooks_are_called_minimally():
+    """
+    As with the legacy minimal-call-first dispatch, a hook that only accepts
+    **kwargs receives no params/xp; hooks naming either receive both via **kwargs.
+    """
+    xp = XPStub()
+    seen = []
+
+    def kwargs_hook(k, state, diag, **kwargs):
+        seen.append(("kwargs", sorted(kwargs)))
+
+    def named_hook(k, state, diag, *, xp=None, **kwargs):
+        seen.append(("named", xp is not None, sorted(kwargs)))
+
+    core_api.run_fn(
+        init={"q": [0.1]},
+        params={"time": {"dt": 1.0}},
+        forcing_stream=_forcing_fn,
+        xp=xp,
+        n_steps=1,
+        hooks=(kwargs_hook, named_hook),
+    )
+
+    assert seen == [("kwargs", []), ("named", True, ["params"])]
+
+
+def test_hooks_advertising_a_signature_are_dispatched_by_it():
+    """
+    A decorator that sets __signature__ (without __wrapped__) decides which keywords
+    the hook receives, exactly as inspect.signature would report them.
+    """
+    seen = []
+
+    def rich_hook(k, state, diag, *, params, xp):
+        pass
+
+    def advertised(*args, **kwargs):
+        seen.append(sorted(kwargs))
+
+    advertised.__signature__ = inspect.signature(rich_hook)
+
+    core_api.run_fn(
+        init={"q": [0.1]},
+        params={"time": {"dt": 1.0}},
+        forcing_stream=_forcing_fn,
+        xp=XPStub(),
+        n_steps=1,
+        hooks=(advertised,),
+    )
+
+    assert seen == [["params", "xp"]]
+
+
+def test_signature_cache_does_not_keep_callables_alive():
+    def make_hook():
+        payload = [0.0] * 10
+
+        def hook(k, state, diag, *, xp):
+            payload[0] = k
+
+        return hook
+
+    hook = make_hook()
+    assert core_api._signature_names(hook) == (frozenset({"k", "state", "diag", "xp"}), False)
+    ref = weakref.ref(hook)
+    del hook
+    gc.collect()
+    assert ref() is None
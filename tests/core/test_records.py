@@ -0,0 +1,73 @@
+from collections.abc import Mapping
+
+import numpy as np
+import pytest
+
+import gcmi.core.api as core_api
+from gcmi.core.records import StateRecord, make_state_record
+from gcmi.hooks import energy_budget_hook
+
+
+def test_state_record_mapping_protocol():
+    Record = make_state_record(("T", "q"))
+    assert make_state_record(["T", "q"]) is Record
+
+    st = Record(T=1.0, q=2.0)
+    assert isinstance(st, StateRecord)
+    assert not hasattr(st, "__dict__")
+    assert st["T"] == 1.0 and "q" in st and "u" not in st
+    st["q"] = 3.0
+    assert dict(st) == {"T": 1.0, "q": 3.0}
+    assert st.get("u", 0.0) == 0.0
+    assert isinstance(st, Mapping)
+    assert list(st.values()) == [1.0, 3.0]
+
+    with pytest.raises(KeyError):
+        st["u"]
+    with pytest.raises(KeyError):
+        st["u"] = 1.0
+
+
+def test_make_state_record_rejects_bad_schema():
+    with pytest.raises(ValueError):
+        make_state_record(())
+    with pytest.raises(ValueError):
+        make_state_record(("T", "T"))
+    for name in ("keys", "items", "get", "_gcmi_keys", "__len__"):
+        with pytest.raises(ValueError, match="reserved"):
+            make_state_record(("T", name))
+    for name in ("T-2m", "class", "2m"):
+        with pytest.raises(ValueError, match="identifiers"):
+            make_state_record(("T", name))
+
+
+def test_init_fn_state_schema_and_hooks():
+    cfg = {
+        "state_schema": ("T", "q"),
+        "state0": {"T": np.array([1.0, 2.0]), "q": np.array([0.5])},
+    }
+    state0, params = core_api.init_fn(cfg, xp=np)
+    assert isinstance(state0, StateRecord)
+
+    final_state, report = core_api.run_fn(
+        state0, params, lambda k: {}, xp=np, n_steps=2, hooks=(energy_budget_hook(),)
+    )
+    assert final_state is state0
+    assert final_state["T"].sum() == 3.0
+    assert report["last_diag"]["budgets"]["energy"]["dry_static"] == 3.0
+
+
+def test_budget_hooks_read_records_by_attribute(monkeypatch):
+    Record = make_state_record(("T", "q"))
+
+    def no_subscript(self, key):
+        raise AssertionError("budget hooks should use attribute access")
+
+    monkeypatch.setattr(Record, "__getitem__", no_subscript)
+    diag = {}
+    energy_budget_hook()(0, Record(T=np.ones(2), q=np.zeros(2)), diag, xp=np)
+    assert diag["budgets"]["energy"] == {
+        "dry_static": 2.0,
+        "latent": 0.0,
+        "kinetic": 0.0,
+    }
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import functools
+import io
 from typing import Any, Dict, List, Tuple
 
 import numpy as np
+import pytest
 
-from gcmi.drivers import run
+from gcmi.drivers import make_runner, run
+from gcmi.hooks import timer_hook
 
 
 def test_minimal_hello_world_runs() -> None:
@@ -86,3 +90,125 @@ def test_diag_normalization_when_none() -> None:
     _, report = run(step, n_steps=1, xp=np)
     assert "last_diag" in report and "timings" in report["last_diag"]
     assert "step_sec" in report["last_diag"]["timings"]
+
+
+def test_step_receives_only_declared_arguments() -> None:
+    seen: List[Tuple[float, Dict[str, Any]]] = []
+
+    def step(dt: float, state: Dict[str, Any], params: Dict[str, Any], *, xp: Any) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        seen.append((dt, params))
+        return state, {}
+
+    run(step, n_steps=2, xp=np, dt=0.5)
+    assert len(seen) == 2
+    assert all(dt == 0.5 and "backend" in params for dt, params in seen)
+
+
+def test_iterable_forcing_stream_yields_empty_after_exhaustion() -> None:
+    seen: List[Dict[str, Any]] = []
+
+    def step(dt: float, state: Dict[str, Any], forcing: Dict[str, Any], *, xp: Any) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        seen.append(forcing)
+        return state, {}
+
+    run(step, n_steps=3, xp=np, forcing_stream=[{"SW": 1.0}])
+    assert seen == [{"SW": 1.0}, {}, {}]
+
+
+def test_omitted_forcing_is_one_shared_read_only_dict() -> None:
+    seen: List[Dict[str, Any]] = []
+
+    def step(dt: float, state: Dict[str, Any], forcing: Dict[str, Any], *, xp: Any) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        seen.append(forcing)
+        return state, {}
+
+    run(step, n_steps=2, xp=np)
+    run(step, n_steps=1, xp=np)
+    assert all(f is seen[0] for f in seen)
+    assert isinstance(seen[0], dict) and seen[0] == {}
+
+    def mutating_step(dt: float, state: Dict[str, Any], forcing: Dict[str, Any], *, xp: Any) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        forcing["SW"] = 1.0
+        return state, {}
+
+    with pytest.raises(TypeError):
+        run(mutating_step, n_steps=1, xp=np)
+
+
+def test_run_flushes_buffered_hook_output() -> None:
+    def step(dt: float, state: Dict[str, Any], *, xp: Any) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        return state, {}
+
+    sink = io.StringIO()
+    run(step, n_steps=3, xp=np, hooks=(timer_hook(sink=sink, fmt="csv"),))
+    lines = sink.getvalue().splitlines()
+    assert [line.split(",")[0] for line in lines] == ["0", "1", "2"]
+
+
+def test_step_wrapped_with_functools_wraps_uses_inner_signature() -> None:
+    def inner(dt: float, state: Dict[str, Any], *, xp: Any) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        return state, {"dt": dt}
+
+    @functools.wraps(inner)
+    def wrapper(*args: Any, **kwargs: Any) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        return inner(*args, **kwargs)
+
+    _, report = run(wrapper, n_steps=1, xp=np, dt=3.0)
+    assert report["last_diag"]["dt"] == 3.0
+
+
+def test_make_runner_reuses_report_out() -> None:
+    def step(dt: float, state: Dict[str, Any], *, xp: Any) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        return state, {}
+
+    runner = make_runner(step, xp=np)
+    report: Dict[str, Any] = {}
+    _, out1 = runner(None, 3, report_out=report)
+    per_step = report["timings"]["per_step_sec"]
+    assert out1 is report and len(per_step) == 3
+
+    _, out2 = runner(None, 2, report_out=report)
+    assert out2 is report
+    assert report["timings"]["per_step_sec"] is per_step and len(per_step) == 2
+    assert "step_sec" in report["last_diag"]["timings"]
+
+
+def test_report_exposes_per_step_timings_as_array() -> None:
+    def step(dt: float, state: Dict[str, Any], *, xp: Any) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        return state, {}
+
+    _, report = run(step, n_steps=4, xp=np)
+    arr = report["timings"]["per_step_sec_arr"]
+    assert isinstance(arr, np.ndarray) and arr.dtype == np.float64
+    assert arr.tolist() == report["timings"]["per_step_sec"]
+    assert report["last_diag"]["timings"]["step_sec"] == arr[-1]
+
+    for n in (0, -1):
+        _, empty = run(step, n_steps=n, xp=np)
+        assert empty["timings"]["per_step_sec"] == [] and empty["timings"]["per_step_sec_arr"].size == 0
+        assert empty["last_diag"] is None
+
+
+def test_jit_runner_rejects_unsupported_inputs() -> None:
+    def step(state: Any, dt: float) -> Any:
+        return state
+
+    with pytest.raises(ValueError):
+        make_runner(step, xp=np, jit="cython")
+    with pytest.raises(TypeError):
+        make_runner(step, xp=np, jit="numba")
+
+
+def test_jit_runner_numba_loop() -> None:
+    numba = pytest.importorskip("numba")
+
+    @numba.njit
+    def step(state: Any, dt: float) -> Any:
+        (T,) = state
+        return (T + dt,)
+
+    cfg = {"state0": {"T": np.zeros(3)}, "params": {}}
+    runner = make_runner(step, cfg=cfg, xp=np, dt=0.5, jit="numba")
+    final_state, report = runner(None, 4)
+    assert np.allclose(final_state["T"], 2.0)
+    assert len(report["timings"]["per_step_sec"]) == 4
@@ -0,0 +1,188 @@
+import io
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from gcmi.drivers.minimal import make_runner, run
+from gcmi.hooks import (combined_budget_hook, energy_budget_hook, flush_hooks,
+                        water_budget_hook)
+from gcmi.hooks.budgets import _sum_any
+
+
+def test_energy_budget_hook_totals_per_term_with_numpy():
+    state = {
+        "T": np.array([1.0, 2.0, 3.0]),
+        "q": np.array([0.5, 0.5]),
+        "u": np.array([1.0, -1.0]),
+        "v": np.array([2.0, 2.0]),
+    }
+    diag = {}
+    hook = energy_budget_hook()
+    hook(0, state, diag, params={}, xp=np)
+
+    assert diag["budgets"]["energy"] == {
+        "dry_static": 6.0,
+        "latent": 1.0,
+        "kinetic": 4.0,
+    }
+
+
+def test_energy_budget_hook_shared_and_missing_vars():
+    state = {"T": np.array([1.0, 1.0])}
+    diag = {}
+    hook = energy_budget_hook(
+        terms=("a", "b", "c"),
+        term_vars={"a": ("T",), "b": ("T", "missing"), "c": ("missing",)},
+    )
+    hook(3, state, diag, xp=np)
+
+    assert diag["budgets"]["energy"] == {"a": 2.0, "b": 2.0, "c": 0.0}
+
+
+def test_water_budget_hook_total():
+    diag = {}
+    water_budget_hook()(0, {"q": np.array([0.25, 0.75])}, diag, xp=np)
+    assert diag["budgets"]["water"] == {"q": 1.0}
+
+
+def test_sink_writes_are_batched_until_flush():
+    sink = io.StringIO()
+    hook = water_budget_hook(sink=sink, batch=3)
+    for k in range(2):
+        hook(k, {"q": np.array([1.0])}, {}, xp=np)
+    assert sink.getvalue() == ""
+
+    hook(2, {"q": np.array([1.0])}, {}, xp=np)
+    assert sink.getvalue() == "0,1.0\n1,1.0\n2,1.0\n"
+
+    hook(3, {"q": np.array([2.0])}, {}, xp=np)
+    flush_hooks((hook,))
+    assert sink.getvalue().endswith("3,2.0\n")
+
+
+def test_standalone_hook_writes_every_record_by_default():
+    sink = io.StringIO()
+    hook = water_budget_hook(sink=sink)
+    hook(0, {"q": np.array([1.0])}, {}, xp=np)
+    assert sink.getvalue() == "0,1.0\n"
+
+
+def test_run_flushes_buffered_records_when_a_step_raises():
+    def step(dt, state, *, xp):
+        if state["n"] == 2:
+            raise RuntimeError("blow up")
+        return {"q": state["q"], "n": state["n"] + 1}, None
+
+    sink = io.StringIO()
+    hook = water_budget_hook(sink=sink, batch=100)
+    cfg = {"state0": {"q": np.array([1.0]), "n": 0}, "params": {}}
+    with pytest.raises(RuntimeError):
+        run(step, n_steps=5, xp=np, cfg=cfg, hooks=(hook,))
+    assert sink.getvalue() == "0,1.0\n1,1.0\n"
+
+
+def test_sum_any_fallback_without_backend():
+    assert _sum_any([0.5, 1.5, 2.0], xp=None) == 4.0
+    assert _sum_any(np.array([1, 2, 3], dtype=np.float32), xp=None) == 6.0
+    assert _sum_any(2.5, xp=None) == 2.5
+    assert _sum_any("not a number", xp=None) == 0.0
+
+
+def test_combined_budget_hook_matches_separate_hooks():
+    state = {
+        "T": np.array([1.0, 2.0]),
+        "q": np.array([0.25, 0.25]),
+        "u": np.array([1.0]),
+        "v": np.array([3.0]),
+    }
+    separate, combined = {}, {}
+    energy_budget_hook()(0, state, separate, xp=np)
+    water_budget_hook()(0, state, separate, xp=np)
+
+    sink = io.StringIO()
+    hook = combined_budget_hook(sink=sink)
+    hook(0, state, combined, xp=np)
+    hook.flush()
+
+    assert combined["budgets"] == separate["budgets"]
+    assert sink.getvalue() == "0,3.0,0.5,4.0,0.5\n"
+
+
+def test_energy_budget_hook_csv_row():
+    sink = io.StringIO()
+    hook = energy_budget_hook(sink=sink, batch=1)
+    hook(7, {"T": np.array([1.5]), "q": np.array([0.25])}, {}, xp=np)
+    assert sink.getvalue() == "7,1.5,0.25,0.0\n"
+
+
+class _FakeStream:
+    def __init__(self, non_blocking=False):
+        self.synchronized = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def wait_event(self, event):
+        pass
+
+    def record(self):
+        return object()
+
+    def synchronize(self):
+        self.synchronized += 1
+
+
+def _fake_cupy():
+    current = _FakeStream()
+    cuda = SimpleNamespace(Stream=_FakeStream, get_current_stream=lambda: current)
+    return SimpleNamespace(__name__="cupy", sum=np.sum, stack=np.stack, cuda=cuda)
+
+
+def test_overlapped_reductions_materialize_in_batches():
+    xp = _fake_cupy()
+    sink = io.StringIO()
+    hook = water_budget_hook(sink=sink, batch=1, overlap_every=2)
+    diags = [{} for _ in range(3)]
+    for k, diag in enumerate(diags):
+        hook(k, {"q": np.array([float(k)])}, diag, xp=xp)
+
+    # Steps 0 and 1 were materialized together; step 2 is still pending
+    assert diags[1]["budgets"]["water"] == {"q": 1.0}
+    assert diags[2]["budgets"]["water"] == {}
+    assert sink.getvalue() == "0,0.0\n1,1.0\n"
+
+    hook.flush()
+    assert diags[2]["budgets"]["water"] == {"q": 2.0}
+    assert sink.getvalue().endswith("2,2.0\n")
+
+
+def test_budget_history_is_a_growing_time_series():
+    hook = energy_budget_hook(terms=("dry_static",), term_vars={"dry_static": ("T",)})
+    for k in range(300):  # beyond the initial capacity
+        diag = {}
+        hook(k, {"T": np.array([float(k), 1.0])}, diag, xp=np)
+        assert diag["budgets"]["energy"] == {"dry_static": k + 1.0}
+
+    history = hook.history
+    assert len(history) == 300
+    assert np.array_equal(history.steps, np.arange(300))
+    assert np.array_equal(history["dry_static"], np.arange(300) + 1.0)
+
+
+def test_budget_history_restarts_when_a_hook_is_reused_across_runs():
+    def step(dt, state, *, xp):
+        return {"q": state["q"] + 1.0}, None
+
+    hook = water_budget_hook()
+    runner = make_runner(
+        step, cfg={"state0": {"q": np.array([0.0])}, "params": {}}, xp=np, hooks=(hook,)
+    )
+    runner(None, 3)
+    runner(None, 2)
+
+    assert np.array_equal(hook.history.steps, [0, 1])
+    assert np.array_equal(hook.history["q"], [1.0, 2.0])
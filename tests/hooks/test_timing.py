@@ -0,0 +1,32 @@
+import io
+import json
+
+import numpy as np
+
+from gcmi.hooks import timer_hook
+from gcmi.hooks.sinks import _dumps, _dumps_stdlib
+
+
+def test_ndjson_records_with_numpy_diag():
+    sink = io.StringIO()
+    hook = timer_hook(sink=sink, fmt="ndjson", include_diag=True)
+    diag = {"timings": {"step_sec": 0.5}, "budgets": {"water": {0: {"q": np.float32(1.0)}}}}
+    hook(0, {}, diag)
+    hook.flush()
+
+    rec = json.loads(sink.getvalue())
+    assert rec["k"] == 0 and rec["step_sec"] == 0.5
+    assert rec["diag"]["budgets"]["water"] == {"0": {"q": 1.0}}
+
+
+def test_ndjson_encoding_is_identical_without_orjson():
+    rec = {
+        "k": 3,
+        "diag": {
+            0: {"q": np.float32(0.1), "n": np.int64(2), "ok": np.bool_(True)},
+            "T": np.arange(3, dtype=np.float32) * np.float32(0.1),
+            "col": np.arange(6.0).reshape(2, 3)[:, 0],
+        },
+    }
+    assert _dumps(rec) == _dumps_stdlib(rec)
+    assert json.loads(_dumps_stdlib(rec))["diag"]["0"]["n"] == 2
@@ -0,0 +1,248 @@
+import numpy as np
+import pytest
+
+from gcmi.middleware import (with_cfl_guard, with_energy_fix, with_hyperdiff,
+                             with_positivity)
+from gcmi.ops import grid as grid_ops
+
+
+def _lap_ones(monkeypatch):
+    # Replace the placeholder Laplacian with a constant one so updates are visible
+    def lap(field, *, xp, dx=None, dy=None):
+        return xp.ones_like(field, dtype=np.float64)
+
+    lap.supports_batch = True
+    monkeypatch.setattr(grid_ops, "laplacian", lap)
+
+
+def _step(state, forcing, params, dt, *, xp=None):
+    return state, {}
+
+
+def test_with_hyperdiff_does_not_modify_input_arrays(monkeypatch):
+    _lap_ones(monkeypatch)
+    T = np.array([1.0, 2.0, 3.0])
+    wrapped = with_hyperdiff(_step, coeff=0.5, vars=("T", "u"))
+
+    st, dg = wrapped({"T": T}, {}, {}, 1.0, xp=np)
+
+    np.testing.assert_allclose(st["T"], [0.5, 1.5, 2.5])
+    np.testing.assert_array_equal(T, [1.0, 2.0, 3.0])
+    assert dg["gcmi_mw"][-1]["name"] == "hyperdiff"
+
+
+def test_with_hyperdiff_batched_path_does_not_modify_input_arrays(monkeypatch):
+    _lap_ones(monkeypatch)
+    T, u = np.zeros(3), np.ones(3)
+    wrapped = with_hyperdiff(_step, coeff=0.5, vars=("T", "u"))
+
+    st, _ = wrapped({"T": T, "u": u}, {}, {}, 1.0, xp=np)
+
+    np.testing.assert_allclose(st["T"], -0.5)
+    np.testing.assert_allclose(st["u"], 0.5)
+    np.testing.assert_array_equal(T, 0.0)
+    np.testing.assert_array_equal(u, 1.0)
+
+
+def test_with_hyperdiff_falls_back_without_out(monkeypatch):
+    _lap_ones(monkeypatch)
+    # Integer arrays cannot absorb a float update in place
+    q = np.array([2, 4], dtype=np.int64)
+    wrapped = with_hyperdiff(_step, coeff=0.5, vars=("q",))
+
+    st, _ = wrapped({"q": q}, {}, {}, 1.0, xp=np)
+
+    np.testing.assert_allclose(st["q"], [1.5, 3.5])
+    np.testing.assert_array_equal(q, [2, 4])
+
+
+def test_with_hyperdiff_batches_same_shaped_fields(monkeypatch):
+    _lap_ones(monkeypatch)
+    calls = []
+    lap = grid_ops.laplacian
+
+    def counting_lap(field, *, xp, dx=None, dy=None):
+        calls.append(np.shape(field))
+        return lap(field, xp=xp)
+
+    counting_lap.supports_batch = True
+    monkeypatch.setattr(grid_ops, "laplacian", counting_lap)
+    state = {"T": np.ones(4), "u": np.zeros(4), "v": np.full(4, 2.0)}
+    wrapped = with_hyperdiff(_step, coeff=0.25)
+
+    st, _ = wrapped(state, {}, {}, 1.0, xp=np)
+
+    assert calls == [(3, 4)]
+    np.testing.assert_allclose(st["T"], 0.75)
+    np.testing.assert_allclose(st["u"], -0.25)
+    np.testing.assert_allclose(st["v"], 1.75)
+
+
+def test_with_hyperdiff_batches_only_matching_dtypes(monkeypatch):
+    calls = []
+
+    def lap(field, *, xp, dx=None, dy=None):
+        calls.append((np.shape(field), field.dtype))
+        return xp.ones_like(field)
+
+    lap.supports_batch = True
+    monkeypatch.setattr(grid_ops, "laplacian", lap)
+    state = {
+        "T": np.ones(4, dtype=np.float32),
+        "u": np.ones(4, dtype=np.float64),
+        "v": np.ones(4, dtype=np.float64),
+    }
+    st, _ = with_hyperdiff(_step, coeff=0.5)(state, {}, {}, 1.0, xp=np)
+
+    assert st["T"].dtype == np.float32
+    assert st["u"].dtype == st["v"].dtype == np.float64
+    assert sorted(calls, key=str) == sorted(
+        [((2, 4), np.dtype(np.float64)), ((4,), np.dtype(np.float32))], key=str
+    )
+
+
+def test_with_hyperdiff_does_not_batch_without_declared_support(monkeypatch):
+    calls = []
+
+    def lap(field, *, xp, dx=None, dy=None):
+        calls.append(np.shape(field))
+        return xp.zeros_like(field)
+
+    monkeypatch.setattr(grid_ops, "laplacian", lap)
+    state = {"T": np.ones((2, 2)), "u": np.ones((2, 2))}
+    with_hyperdiff(_step, coeff=0.5, vars=("T", "u"))(state, {}, {}, 1.0, xp=np)
+
+    assert calls == [(2, 2), (2, 2)]
+
+
+def test_with_hyperdiff_ragged_fields_fall_back_per_variable(monkeypatch):
+    _lap_ones(monkeypatch)
+    state = {"T": np.ones(3), "u": np.ones(2)}
+    wrapped = with_hyperdiff(_step, coeff=1.0, vars=("T", "u"))
+
+    st, _ = wrapped(state, {}, {}, 1.0, xp=np)
+
+    np.testing.assert_allclose(st["T"], 0.0)
+    np.testing.assert_allclose(st["u"], 0.0)
+
+
+def test_with_positivity_does_not_modify_input_arrays():
+    q = np.array([-1.0, 2.0])
+    st, dg = with_positivity(_step)({"q": q}, {}, {}, 1.0, xp=np)
+
+    np.testing.assert_array_equal(st["q"], [0.0, 2.0])
+    np.testing.assert_array_equal(q, [-1.0, 2.0])
+    assert dg["gcmi_mw"][-1]["name"] == "positivity"
+
+
+def test_with_positivity_inplace_is_opt_in():
+    fresh = []
+
+    def fresh_step(state, forcing, params, dt, *, xp=None):
+        fresh.append(state["q"].copy())
+        return {"q": fresh[-1]}, {}
+
+    q = np.array([-0.5, 0.25])
+    st, _ = with_positivity(fresh_step, inplace=True)({"q": q}, {}, {}, 1.0, xp=np)
+
+    assert st["q"] is fresh[0]
+    np.testing.assert_array_equal(fresh[0], [0.0, 0.25])
+    np.testing.assert_array_equal(q, [-0.5, 0.25])
+
+
+def test_static_mw_meta_entries_are_fresh_per_step():
+    wrapped = with_energy_fix(_step)
+    _, d1 = wrapped({}, {}, {}, 1.0, xp=np)
+    _, d2 = wrapped({}, {}, {}, 1.0, xp=np)
+
+    assert d1["gcmi_mw"] == d2["gcmi_mw"]
+    assert d1["gcmi_mw"] == [
+        {"name": "energy_fix", "budget": ("dry_static", "latent", "kinetic")}
+    ]
+    assert d1["gcmi_mw"][0] is not d2["gcmi_mw"][0]
+
+
+def test_collect_meta_false_skips_mw_entries():
+    wrapped = with_energy_fix(
+        with_cfl_guard(_step, wave_speed_cb=lambda s, p, xp: 0.0, collect_meta=False),
+        collect_meta=False,
+    )
+    _, dg = wrapped({}, {}, {}, 1.0, xp=np)
+
+    assert "gcmi_mw" not in dg
+
+
+def test_cfl_guard_single_step_and_substep_metadata():
+    dts = []
+
+    def step(state, forcing, params, dt, *, xp=None):
+        dts.append(dt)
+        return state, {}
+
+    wrapped = with_cfl_guard(step, cfl_max=0.5, wave_speed_cb=lambda s, p, xp: 1.0)
+
+    _, dg = wrapped({}, {}, {"grid": {"dx_min": 4.0}}, 1.0, xp=np)
+    assert dg["gcmi_mw"] == [
+        {
+            "name": "cfl_guard",
+            "cfl": 0.25,
+            "n_substeps": 1,
+            "vmax": 1.0,
+            "dx": 4.0,
+            "dt": 1.0,
+        }
+    ]
+
+    dts.clear()
+    _, dg = wrapped({}, {}, {}, 1.0, xp=np)  # dx defaults to 1.0 -> cfl 1.0
+    assert dts == [0.5, 0.5]
+    assert dg["gcmi_mw"][-1]["n_substeps"] == 2
+    assert dg["gcmi_mw"][-1]["dt_sub"] == 0.5
+
+
+def test_cfl_guard_rejects_non_positive_cfl_max():
+    with pytest.raises(ValueError):
+        with_cfl_guard(_step, cfl_max=0.0, wave_speed_cb=lambda s, p, xp: 1.0)
+
+
+def test_cfl_guard_n_sub_max_caps_substeps():
+    dts = []
+
+    def step(state, forcing, params, dt, *, xp=None):
+        dts.append(dt)
+        return state, {}
+
+    wrapped = with_cfl_guard(
+        step, cfl_max=0.5, wave_speed_cb=lambda s, p, xp: 10.0, n_sub_max=4
+    )
+    _, dg = wrapped({}, {}, {}, 1.0, xp=np)
+
+    assert dts == [0.25] * 4
+    assert dg["gcmi_mw"][-1]["n_substeps"] == 4
+
+
+def test_cfl_guard_recompute_every_refreshes_wave_speed():
+    dts = []
+
+    def step(state, forcing, params, dt, *, xp=None):
+        dts.append(dt)
+        return {"speed": state["speed"] / 2.0}, {}
+
+    # Wave speed halves every substep; refreshing lets later substeps grow
+    wrapped = with_cfl_guard(
+        step,
+        cfl_max=1.0,
+        wave_speed_cb=lambda s, p, xp: s["speed"],
+        recompute_every=1,
+    )
+    _, dg = wrapped({"speed": 4.0}, {}, {}, 1.0, xp=np)
+
+    assert dts == [0.25, 0.5, 0.25]
+    assert sum(dts) == 1.0
+    assert dg["gcmi_mw"][-1]["n_substeps"] == 3
+    meta = dg["gcmi_mw"][-1]
+    assert (meta["dt_sub"], meta["dt_sub_min"], meta["dt_sub_max"]) == (
+        0.25,
+        0.25,
+        0.5,
+    )
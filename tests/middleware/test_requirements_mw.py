@@ -1,7 +1,7 @@
 import pytest
 
 from gcmi.middleware.requirements import with_requirements_check
-from gcmi.utils.requirements import Requirement, requires
+from gcmi.utils.requirements import Requirement, RequirementError, requires
 
 
 def make_dummy_step(diag_key: str = "ok"):
@@ -44,20 +44,20 @@ def test_with_requirements_check_records_warnings_and_skips_after_max_checks():
     )
 
     # Call 1: expect requirements summary with an error entry
-    st1, dg1 = wrapped(state={}, forcing={}, params={}, dt=1.0, xp=None)
+    _, dg1 = wrapped(state={}, forcing={}, params={}, dt=1.0, xp=None)
     assert "gcmi_requirements" in dg1
     assert len(dg1["gcmi_requirements"]) == 1
     assert dg1["gcmi_requirements"][0]["errors"]
 
     # Call 2: still within max_checks -> another entry
-    st2, dg2 = wrapped(state={}, forcing={}, params={}, dt=1.0, xp=None)
+    _, dg2 = wrapped(state={}, forcing={}, params={}, dt=1.0, xp=None)
     assert "gcmi_requirements" in dg2
     assert (
         len(dg2["gcmi_requirements"]) == 1
     )  # per-call diag only contains its own entry
 
     # Call 3: beyond max_checks -> no validation/entry
-    st3, dg3 = wrapped(state={}, forcing={}, params={}, dt=1.0, xp=None)
+    _, dg3 = wrapped(state={}, forcing={}, params={}, dt=1.0, xp=None)
     assert "gcmi_requirements" not in dg3
 
 
@@ -75,7 +75,31 @@ def test_with_requirements_check_passes_when_requirements_met():
     )
 
     params = {"spectral": {"radius": 6_371_229.0}}
-    st, dg = wrapped(state={}, forcing={}, params=params, dt=1.0, xp=None)
+    _, dg = wrapped(state={}, forcing={}, params=params, dt=1.0, xp=None)
     # No errors/warnings recorded when satisfied
     assert "gcmi_requirements" not in dg
     assert dg.get("inner") is True
+
+
+def test_with_requirements_check_counts_raising_calls_toward_max_checks():
+    @requires(Requirement("params", "spectral.radius"))
+    def step(state, forcing, params, dt, *, xp=None):
+        return state, {"inner": True}
+
+    wrapped = with_requirements_check(step, max_checks=1, raise_on_error=True)
+
+    with pytest.raises(RequirementError):
+        wrapped(state={}, forcing={}, params={}, dt=1.0, xp=None)
+    # Warmup is over: later calls bypass validation
+    _, dg = wrapped(state={}, forcing={}, params={}, dt=1.0, xp=None)
+    assert dg == {"inner": True}
+
+
+def test_with_requirements_check_without_requirements_passes_through():
+    step = make_dummy_step()
+    wrapped = with_requirements_check(step)
+
+    st, dg = wrapped(state={"T": 1}, forcing={}, params={}, dt=1.0, xp=None)
+    assert st == {"T": 1}
+    assert dg == {"ok": True}
+    assert wrapped.__wrapped__ is step
@@ -0,0 +1,96 @@
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from gcmi.ops import grid as grid_ops
+
+
+class _NoOps:
+    # xp without any of the optional functions
+    pass
+
+
+def test_clamp_min_uses_backend_or_scalar_fallback():
+    np.testing.assert_array_equal(
+        grid_ops.clamp_min(np.array([-1.0, 2.0]), 0.0, xp=np), [0.0, 2.0]
+    )
+    assert grid_ops.clamp_min(-3.0, 0.0, xp=_NoOps()) == 0.0
+    field = [-1.0, 2.0]
+    assert grid_ops.clamp_min(field, 0.0, xp=_NoOps()) is field
+
+
+def test_total_backend_and_fallbacks():
+    assert grid_ops.total(np.arange(4.0), xp=np) == 6.0
+    assert grid_ops.total(2, xp=_NoOps()) == 2.0
+    assert grid_ops.total([1.0, 2.0], xp=_NoOps()) == 0.0
+
+
+class _RaisingOps:
+    # xp whose reductions reject every input
+    def maximum(self, field, lower):
+        raise TypeError("unsupported")
+
+    def sum(self, field):
+        raise TypeError("unsupported")
+
+
+def test_scalar_fallbacks_accept_numpy_and_other_numbers():
+    assert grid_ops.clamp_min(np.float32(-1.0), 0.0, xp=_NoOps()) == 0.0
+    assert grid_ops.clamp_min(np.array(-1.0), 0.0, xp=_NoOps()) == 0.0
+    assert grid_ops.clamp_min(Fraction(-1, 2), 0.0, xp=_NoOps()) == 0.0
+    assert grid_ops.total(np.float32(2.5), xp=_NoOps()) == 2.5
+    assert grid_ops.total(np.array(2.5), xp=_NoOps()) == 2.5
+
+
+def test_backend_errors_fall_back_instead_of_propagating():
+    assert grid_ops.clamp_min(-3.0, 0.0, xp=_RaisingOps()) == 0.0
+    assert grid_ops.total(np.float32(2.5), xp=_RaisingOps()) == 2.5
+    assert grid_ops.total([1.0, 2.0], xp=_RaisingOps()) == 0.0
+
+
+def test_dx_min_from_params():
+    assert grid_ops.dx_min_from_params({"grid": {"dx_min": "250"}}) == 250.0
+    assert grid_ops.dx_min_from_params({"grid": {}}) is None
+    assert grid_ops.dx_min_from_params({"grid": 1.0}) is None
+    assert grid_ops.dx_min_from_params({"grid": {"dx_min": "n/a"}}) is None
+    assert grid_ops.dx_min_from_params({}) is None
+
+
+def test_clamp_min_inplace_writes_into_field_when_possible():
+    field = np.array([-1.0, 2.0])
+    assert grid_ops.clamp_min(field, 0.0, xp=np, inplace=True) is field
+    np.testing.assert_array_equal(field, [0.0, 2.0])
+
+    ints = np.array([-1, 2])
+    out = grid_ops.clamp_min(ints, 0.5, xp=np, inplace=True)
+    assert out is not ints
+    np.testing.assert_array_equal(out, [0.5, 2.0])
+    np.testing.assert_array_equal(ints, [-1, 2])
+
+
+def test_laplacian_5point_generic_path(monkeypatch):
+    # Force the xp.roll implementation even when numba is installed
+    monkeypatch.setattr(grid_ops, "_numba_kernels", False)
+    field = np.zeros((3, 4))
+    field[1, 2] = 1.0
+    lap = grid_ops.laplacian_5point(field, xp=np, dx=1.0, dy=2.0)
+    assert lap[1, 2] == -2.0 - 0.5
+    assert lap[1, 1] == lap[1, 3] == 1.0
+    assert lap[0, 2] == lap[2, 2] == 0.25
+    assert lap.sum() == 0.0
+
+
+def test_numba_kernels_match_generic_path(monkeypatch):
+    pytest.importorskip("numba")
+    rng = np.random.default_rng(0)
+    field = rng.standard_normal((5, 7)).astype(np.float32)
+    field[0, 0] = np.nan
+
+    assert grid_ops.warm_kernels()
+    lap = grid_ops.laplacian_5point(field[1:], xp=np, dx=2.0, dy=3.0)
+
+    monkeypatch.setattr(grid_ops, "_numba_kernels", False)
+    np.testing.assert_allclose(
+        lap, grid_ops.laplacian_5point(field[1:], xp=np, dx=2.0, dy=3.0), atol=1e-5
+    )
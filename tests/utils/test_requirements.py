@@ -1,6 +1,15 @@
-from gcmi.utils.requirements import (Requirement, RequirementError,
-                                     get_requirements, requires,
-                                     validate_requirements)
+import copy
+import pickle
+import sys
+
+import numpy as np
+import pytest
+
+from gcmi.utils.requirements import (Requirement, RequirementError, at_least,
+                                     at_most, get_requirements, greater_than,
+                                     group_requirements, less_than, requires,
+                                     validate_requirements,
+                                     validate_requirements_grouped)
 
 
 def test_validate_requirements_ok_and_types_and_predicate():
@@ -35,7 +44,7 @@ def test_validate_requirements_missing_and_type_violation_and_predicate_violatio
         "grid": {"dx_min": 1000.0},
     }  # radius <= 0 and dx_min float
     forcing = {}
-    errors, warns = validate_requirements(
+    errors, _ = validate_requirements(
         state=state, params=params, forcing=forcing, requirements=reqs
     )
     # Expect 3 errors
@@ -65,6 +74,8 @@ def test_requires_decorator_and_get_requirements_collects_chain():
 
     reqs = get_requirements(wrapped_inner)
     assert any(r.where == "params" and r.path == "spectral.radius" for r in reqs)
+    assert get_requirements(inner) == reqs
+    assert get_requirements(lambda: None) == ()
 
 
 def test_requirement_error_str():
@@ -100,3 +111,157 @@ def test_requirement_error_str():
         "PARAMS.spectral.radius" or "params.spectral.radius"
     )  # case can vary based on formatting
     assert "FORCING.SW" or "forcing.SW"
+
+
+def test_requirement_pre_splits_path_without_affecting_equality():
+    r = Requirement("params", "spectral.semi_implicit.theta")
+    assert r._segments == ("spectral", "semi_implicit", "theta")
+    assert r == Requirement("params", "spectral.semi_implicit.theta")
+    assert hash(r) == hash(Requirement("params", "spectral.semi_implicit.theta"))
+    assert "_segments" not in repr(r)
+
+
+def test_validate_requirements_reports_non_mapping_segment():
+    errors, _ = validate_requirements(
+        state={"T": [1.0, 2.0]},
+        params=None,
+        forcing=None,
+        requirements=[Requirement("state", "T.mean")],
+    )
+    assert len(errors) == 1
+    assert "segment 'mean' encountered non-mapping type list" in errors[0].message
+
+
+def test_validate_requirements_does_not_descend_into_array_leaves():
+    state = {"T": np.zeros(3, dtype=[("a", float)])}
+    for path in ("T.x", "T.0", "T.a", "T.a.b"):
+        errors, _ = validate_requirements(
+            state=state,
+            params=None,
+            forcing=None,
+            requirements=[Requirement("state", path)],
+        )
+        assert len(errors) == 1, path
+        assert "encountered non-mapping type ndarray" in errors[0].message
+
+
+def test_group_requirements_partitions_and_rejects_unknown_container():
+    reqs = [
+        Requirement("forcing", "SW"),
+        Requirement("state", "T"),
+        Requirement("params", "grid.dx_min"),
+        Requirement("state", "q", severity="warn"),
+    ]
+    state_reqs, params_reqs, forcing_reqs = group_requirements(reqs)
+    assert [r.path for r in state_reqs] == ["T", "q"]
+    assert [r.path for r in params_reqs] == ["grid.dx_min"]
+    assert [r.path for r in forcing_reqs] == ["SW"]
+
+    errors, warns = validate_requirements_grouped(
+        state={"T": 1.0},
+        params={"grid": {"dx_min": 1.0}},
+        forcing=None,
+        state_reqs=state_reqs,
+        params_reqs=params_reqs,
+        forcing_reqs=forcing_reqs,
+    )
+    assert [v.path for v in errors] == ["SW"]
+    assert "is None" in errors[0].message
+    assert [v.path for v in warns] == ["q"]
+
+    with pytest.raises(ValueError):
+        group_requirements([Requirement("diag", "x")])  # type: ignore[arg-type]
+
+
+def test_validate_requirements_keeps_declaration_order_and_unknown_containers():
+    reqs = [
+        Requirement("forcing", "SW"),
+        Requirement("diag", "x"),  # type: ignore[arg-type]
+        Requirement("state", "T"),
+    ]
+    errors, _ = validate_requirements(
+        state={}, params=None, forcing=None, requirements=reqs
+    )
+    assert [v.path for v in errors] == ["SW", "x", "T"]
+    assert errors[1].message == "Container 'diag' is None; cannot check path 'x'"
+
+
+def test_violation_is_a_named_tuple():
+    errors, _ = validate_requirements(
+        state={}, params=None, forcing=None, requirements=[Requirement("state", "T")]
+    )
+    (v,) = errors
+    where, path, severity, message, requirement = v
+    assert (where, path, severity) == ("state", "T", "error")
+    assert v.message == message and v.requirement is requirement
+
+
+def test_compiled_getters_resolve_and_report_missing_paths():
+    params = {"a": {"b": {"c": 3}}, "x": 1}
+    reqs = [
+        Requirement("params", "x", type=int),
+        Requirement("params", "a.b", type=dict),
+        Requirement("params", "a.b.c", predicate=lambda c: c == 3),
+        Requirement("params", "a.b.missing", required=False),
+        Requirement("params", "a.x.c"),
+    ]
+    errors, warns = validate_requirements(
+        state=None, params=params, forcing=None, requirements=reqs
+    )
+    assert warns == []
+    assert [v.path for v in errors] == ["a.x.c"]
+    assert "Missing key 'x' while resolving 'a.x.c'" in errors[0].message
+
+
+def test_get_requirements_is_memoized_and_invalidated_by_requires():
+    def inner(state, forcing, params, dt, *, xp):
+        return state, {}
+
+    def outer(*a, **k):
+        return inner(*a, **k)
+
+    setattr(outer, "__wrapped__", inner)
+
+    assert get_requirements(outer) == ()
+    first = get_requirements(outer)
+    assert get_requirements(outer) is first
+
+    # Decorating a function inside an already-resolved chain is picked up
+    requires(Requirement("state", "T"))(inner)
+    assert [r.path for r in get_requirements(outer)] == ["T"]
+
+
+def test_comparison_predicates_match_python_comparisons():
+    for x in (-1.0, 0, 0.5, 1):
+        assert greater_than(0)(x) == (x > 0)
+        assert at_least(0)(x) == (x >= 0)
+        assert less_than(0.5)(x) == (x < 0.5)
+        assert at_most(0.5)(x) == (x <= 0.5)
+
+    reqs = [Requirement("params", "r", type=(int, float), predicate=greater_than(0))]
+    ok, _ = validate_requirements(
+        state=None, params={"r": 6.4e6}, forcing=None, requirements=reqs
+    )
+    bad, _ = validate_requirements(
+        state=None, params={"r": -1.0}, forcing=None, requirements=reqs
+    )
+    assert ok == [] and bad[0].message == "Predicate returned False"
+
+
+def test_requirement_interns_where_and_severity():
+    where = "".join(["par", "ams"])
+    severity = "".join(["wa", "rn"])
+    r = Requirement(where, "x", severity=severity)  # type: ignore[arg-type]
+    assert r.where is sys.intern("params")
+    assert r.severity is sys.intern("warn")
+    assert r == Requirement("params", "x", severity="warn")
+
+
+def test_requirement_is_slotted_and_picklable():
+    r = Requirement("params", "time.dt", type=float, severity="warn")
+    assert not hasattr(r, "__dict__")
+    for clone in (pickle.loads(pickle.dumps(r)), copy.deepcopy(r)):
+        assert clone == r
+        assert validate_requirements(
+            state=None, params={"time": {"dt": 1}}, forcing=None, requirements=[clone]
+        )[1][0].message.startswith("Expected type")
@@ -1,6 +1,7 @@
 import pytest
 
-from gcmi.utils.struct import require, split_keys, take, take_nested
+from gcmi.utils.struct import (_compile_path, _getter, require, split_keys,
+                               take, take_nested)
 
 
 def test_take_happy_path():
@@ -67,3 +68,21 @@ def test_split_keys_basic():
     picked, rest = split_keys(params, "grid", "backend", "nonexistent")
     assert picked == {"grid": {"dx_min": 1000}, "backend": {"xp": "numpy"}}
     assert rest == {"energy_budget": {"target_total": 42.0}}
+    assert list(split_keys(params, "backend", "grid")[0]) == ["backend", "grid"]
+
+
+def test_take_reuses_getter_per_key_tuple():
+    _getter.cache_clear()
+    for d in ({"a": 1, "b": 2}, {"a": 3, "b": 4}):
+        take(d, "a", "b")
+        require(d, "a", "b")
+    assert _getter.cache_info().misses == 1
+
+
+def test_take_nested_compiles_each_path_once():
+    _compile_path.cache_clear()
+    params = {"grid": {"dx_min": 1000}, "spectral": {"semi_implicit": {"theta": 0.5}}}
+    for _ in range(3):
+        take_nested(params, "grid.dx_min", "spectral.semi_implicit.theta")
+    info = _compile_path.cache_info()
+    assert (info.misses, info.hits) == (2, 4)